@@ -232,8 +232,9 @@ class CarteiraCLI:
         print("-"*80)
         
         alocacao, total = self.processador.obter_resumo_alocacao()
-        for _, row in alocacao.iterrows():
-            print(f"{row['Categoria']:20} | {FormatadorDados.formatar_moeda(row['Valor Total']):20} | {row['Percentual']:6.2f}%")
+        valores = FormatadorDados.formatar_moeda_series(alocacao['Valor Total'])
+        for categoria, valor, percentual in zip(alocacao['Categoria'], valores, alocacao['Percentual']):
+            print(f"{categoria:20} | {valor:20} | {percentual:6.2f}%")
         
         # Alertas
         alertas = self.processador.obter_alertas_vencimento()
@@ -242,9 +243,10 @@ class CarteiraCLI:
             print("⚠️  ALERTAS DE VENCIMENTO (próximos 60 dias)")
             print("-"*80)
             
-            for _, row in alertas.head(5).iterrows():
-                dias = int(row['Dias para Vencer']) if pd.notna(row['Dias para Vencer']) else 0
-                print(f"{row['Ativo']:20} | {dias:3} dias | {row['Status Vencimento']}")
+            colunas = ['Ativo', 'Dias para Vencer', 'Status Vencimento']
+            for ativo, dias, status in alertas.head(5)[colunas].itertuples(index=False, name=None):
+                dias = int(dias) if pd.notna(dias) else 0
+                print(f"{ativo:20} | {dias:3} dias | {status}")
         
         # Análise de diversificação
         analisador = AnalisadorAvancado(self.processador.carteira_consolidada)
@@ -76,11 +76,11 @@ class AnalisadorAvancado:
             return None
         
         # Análise por categoria
-        por_categoria = self.carteira.groupby('Categoria')['Valor'].sum()
+        por_categoria = self.carteira.groupby('Categoria', observed=True)['Valor'].sum()
         num_categorias = len(por_categoria)
         
         # Análise por classe
-        por_classe = self.carteira.groupby('Classe')['Valor'].sum()
+        por_classe = self.carteira.groupby('Classe', observed=True)['Valor'].sum()
         num_classes = len(por_classe)
         
         # Análise por ativo
@@ -139,11 +139,12 @@ class AnalisadorAvancado:
         
         total = self.carteira['Valor'].sum()
         
-        # Contar por status
+        # Contar por status (ignorando status categóricos sem ativos)
         status_counts = self.carteira['Status Vencimento'].value_counts()
+        status_counts = status_counts[status_counts > 0]
         
         # Valor por status
-        status_valores = self.carteira.groupby('Status Vencimento')['Valor'].sum()
+        status_valores = self.carteira.groupby('Status Vencimento', observed=True)['Valor'].sum()
         
         # Análise por período
         hoje = pd.Timestamp.now()
@@ -233,7 +234,7 @@ class AnalisadorAvancado:
         
         total = self.carteira['Valor'].sum()
         
-        top = self.carteira.groupby('Classe').agg({
+        top = self.carteira.groupby('Classe', observed=True).agg({
             'Valor': 'sum',
             'Categoria': 'first',
             'Ativo': 'count'
@@ -8,7 +8,7 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib import rcParams
 import seaborn as sns
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, TextIO, Tuple
 from pathlib import Path
 import logging
 
@@ -340,11 +340,15 @@ class GeradorRelatorioHTML:
         vencimentos: Dict,
         risco: Dict,
         top_ativos: pd.DataFrame,
-        caminhos_graficos: Dict[str, str]
+        caminhos_graficos: Dict[str, str],
+        saida: Optional[TextIO] = None
     ) -> Tuple[bool, str]:
         """
         Gera relatório completo em HTML.
         
+        Com saida, cada trecho é gravado diretamente no arquivo à medida que é
+        formatado, sem montar o documento inteiro em memória.
+        
         Args:
             nome_cliente: Nome do cliente
             data_relatorio: Data do relatório
@@ -355,12 +359,17 @@ class GeradorRelatorioHTML:
             risco: Dicionário com análise de risco
             top_ativos: DataFrame com top ativos
             caminhos_graficos: Dicionário com caminhos dos gráficos
+            saida: Arquivo de texto aberto onde gravar o HTML (opcional)
             
         Returns:
-            Tupla (sucesso, conteúdo HTML)
+            Tupla (sucesso, conteúdo HTML); com saida o conteúdo é gravado
+            no arquivo e a string retornada fica vazia
         """
         try:
-            html = f"""
+            partes = []
+            escrever = saida.write if saida is not None else partes.append
+            
+            escrever(f"""
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -620,21 +629,22 @@ class GeradorRelatorioHTML:
                     </tr>
                 </thead>
                 <tbody>
-"""
+""")
             
             # Adicionar linhas da tabela de alocação
             if alocacao is not None:
-                for _, row in alocacao.iterrows():
-                    html += f"""
+                colunas = ['Categoria', 'Valor Total', 'Percentual', 'Quantidade']
+                for categoria, valor_total, percentual, quantidade in alocacao[colunas].itertuples(index=False, name=None):
+                    escrever(f"""
                     <tr>
-                        <td>{row['Categoria']}</td>
-                        <td>R$ {row['Valor Total']:,.2f}</td>
-                        <td>{row['Percentual']:.2f}%</td>
-                        <td>{row['Quantidade']}</td>
+                        <td>{categoria}</td>
+                        <td>R$ {valor_total:,.2f}</td>
+                        <td>{percentual:.2f}%</td>
+                        <td>{quantidade}</td>
                     </tr>
-"""
+""")
             
-            html += """
+            escrever("""
                 </tbody>
             </table>
         </div>
@@ -642,7 +652,7 @@ class GeradorRelatorioHTML:
         <!-- DIVERSIFICAÇÃO -->
         <div class="section">
             <h2>🎯 Análise de Diversificação</h2>
-"""
+""")
             
             if diversificacao:
                 score = diversificacao.get('diversificacao_score', 0)
@@ -658,7 +668,7 @@ class GeradorRelatorioHTML:
                     alerta_class = "alerta critico"
                     msg = "✗ Carteira pouco diversificada"
                 
-                html += f"""
+                escrever(f"""
             <div class="{alerta_class}">
                 <strong>{msg}</strong> - Score: {score}/100
             </div>
@@ -684,9 +694,9 @@ class GeradorRelatorioHTML:
             
             <h3>Classificação: {classe}</h3>
             <p>Índice de Herfindahl: {diversificacao.get('hhi', 0):.2f}</p>
-"""
+""")
             
-            html += """
+            escrever("""
         </div>
         
         <!-- VENCIMENTOS -->
@@ -695,10 +705,10 @@ class GeradorRelatorioHTML:
             <div class="grafico">
                 <img src="{}" alt="Análise de Vencimentos">
             </div>
-""".format(caminhos_graficos.get('vencimentos', ''))
+""".format(caminhos_graficos.get('vencimentos', '')))
             
             if vencimentos:
-                html += f"""
+                escrever(f"""
             <div class="stats-grid">
                 <div class="stat-card">
                     <label>Próximos 30 dias</label>
@@ -717,9 +727,9 @@ class GeradorRelatorioHTML:
                     <div class="value">{vencimentos.get('percentual_vencido', 0):.1f}%</div>
                 </div>
             </div>
-"""
+""")
             
-            html += """
+            escrever("""
         </div>
         
         <!-- RISCO -->
@@ -728,7 +738,7 @@ class GeradorRelatorioHTML:
             <div class="grafico">
                 <img src="{}" alt="Análise de Risco">
             </div>
-""".format(caminhos_graficos.get('risco', ''))
+""".format(caminhos_graficos.get('risco', '')))
             
             if risco:
                 nivel = risco.get('nivel_risco_geral', 'Desconhecido')
@@ -739,7 +749,7 @@ class GeradorRelatorioHTML:
                 else:
                     alerta_class = "alerta sucesso"
                 
-                html += f"""
+                escrever(f"""
             <div class="{alerta_class}">
                 <strong>Nível de Risco Geral: {nivel}</strong>
             </div>
@@ -758,9 +768,9 @@ class GeradorRelatorioHTML:
                     <div class="value">{risco.get('risco_baixo_percentual', 0):.1f}%</div>
                 </div>
             </div>
-"""
+""")
             
-            html += """
+            escrever("""
         </div>
         
         <!-- TOP ATIVOS -->
@@ -779,20 +789,21 @@ class GeradorRelatorioHTML:
                     </tr>
                 </thead>
                 <tbody>
-""".format(caminhos_graficos.get('top_ativos', ''))
+""".format(caminhos_graficos.get('top_ativos', '')))
             
             if top_ativos is not None:
-                for _, row in top_ativos.iterrows():
-                    html += f"""
+                colunas = ['Ativo', 'Categoria', 'Valor', 'Percentual']
+                for ativo, categoria, valor, percentual in top_ativos[colunas].itertuples(index=False, name=None):
+                    escrever(f"""
                     <tr>
-                        <td>{row['Ativo']}</td>
-                        <td>{row['Categoria']}</td>
-                        <td>R$ {row['Valor']:,.2f}</td>
-                        <td>{row['Percentual']:.2f}%</td>
+                        <td>{ativo}</td>
+                        <td>{categoria}</td>
+                        <td>R$ {valor:,.2f}</td>
+                        <td>{percentual:.2f}%</td>
                     </tr>
-"""
+""")
             
-            html += """
+            escrever("""
                 </tbody>
             </table>
         </div>
@@ -804,9 +815,9 @@ class GeradorRelatorioHTML:
     </div>
 </body>
 </html>
-"""
+""")
             
-            return True, html
+            return True, ''.join(partes)
         
         except Exception as e:
             logger.error(f"Erro ao gerar relatório HTML: {str(e)}")
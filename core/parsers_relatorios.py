@@ -6,6 +6,7 @@ Cada relatório tem uma estrutura diferente e requer um parser específico
 
 import pandas as pd
 import logging
+import functools
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import numpy as np
@@ -23,6 +24,8 @@ class ParserRendaFixa:
         'IR - Opção Cliente', 'IOF - Opção Cliente', 'Valor Líquido - Opção Cliente'
     ]
     
+    COLUNAS_ESSENCIAIS = frozenset(['Conta', 'Nome', 'Produto', 'Data Vencimento', 'Valor Bruto - Opção Cliente'])
+    
     @staticmethod
     def validar_estrutura(df: pd.DataFrame) -> Tuple[bool, str]:
         """
@@ -38,11 +41,10 @@ class ParserRendaFixa:
             return False, "DataFrame vazio"
         
         # Verificar colunas essenciais
-        colunas_essenciais = ['Conta', 'Nome', 'Produto', 'Data Vencimento', 'Valor Bruto - Opção Cliente']
-        colunas_faltantes = [col for col in colunas_essenciais if col not in df.columns]
+        colunas_faltantes = ParserRendaFixa.COLUNAS_ESSENCIAIS.difference(df.columns)
         
         if colunas_faltantes:
-            return False, f"Colunas faltantes: {', '.join(colunas_faltantes)}"
+            return False, f"Colunas faltantes: {', '.join(sorted(colunas_faltantes))}"
         
         return True, "Estrutura válida"
     
@@ -147,6 +149,8 @@ class ParserFundos:
         'Quantidade', 'Valor Bruto', 'IR', 'IOF', 'Valor Líquido'
     ]
     
+    COLUNAS_ESSENCIAIS = frozenset(['Conta', 'Nome', 'Produto', 'Categoria', 'Valor Bruto'])
+    
     @staticmethod
     def validar_estrutura(df: pd.DataFrame) -> Tuple[bool, str]:
         """Valida se o DataFrame tem a estrutura esperada de Fundos"""
@@ -154,11 +158,10 @@ class ParserFundos:
             return False, "DataFrame vazio"
         
         # Verificar colunas essenciais
-        colunas_essenciais = ['Conta', 'Nome', 'Produto', 'Categoria', 'Valor Bruto']
-        colunas_faltantes = [col for col in colunas_essenciais if col not in df.columns]
+        colunas_faltantes = ParserFundos.COLUNAS_ESSENCIAIS.difference(df.columns)
         
         if colunas_faltantes:
-            return False, f"Colunas faltantes: {', '.join(colunas_faltantes)}"
+            return False, f"Colunas faltantes: {', '.join(sorted(colunas_faltantes))}"
         
         return True, "Estrutura válida"
     
@@ -238,17 +241,18 @@ class ParserPrevidencia:
         'Regime Tributario', 'Quantidade', 'Valor Bruto'
     ]
     
+    COLUNAS_ESSENCIAIS = frozenset(['Conta', 'Nome', 'Produto', 'Tipo Previdencia', 'Valor Bruto'])
+    
     @staticmethod
     def validar_estrutura(df: pd.DataFrame) -> Tuple[bool, str]:
         """Valida se o DataFrame tem a estrutura esperada de Previdencia"""
         if df is None or df.empty:
             return False, "DataFrame vazio"
         
-        colunas_essenciais = ['Conta', 'Nome', 'Produto', 'Tipo Previdencia', 'Valor Bruto']
-        colunas_faltantes = [col for col in colunas_essenciais if col not in df.columns]
+        colunas_faltantes = ParserPrevidencia.COLUNAS_ESSENCIAIS.difference(df.columns)
         
         if colunas_faltantes:
-            return False, f"Colunas faltantes: {', '.join(colunas_faltantes)}"
+            return False, f"Colunas faltantes: {', '.join(sorted(colunas_faltantes))}"
         
         return True, "Estrutura valida"
     
@@ -315,17 +319,18 @@ class ParserCOE:
         'Data Emissao', 'Vencimento', 'Valor Bruto', 'Assessor'
     ]
     
+    COLUNAS_ESSENCIAIS = frozenset(['Conta', 'Nome', 'Produto', 'Vencimento', 'Valor Bruto'])
+    
     @staticmethod
     def validar_estrutura(df: pd.DataFrame) -> Tuple[bool, str]:
         """Valida se o DataFrame tem a estrutura esperada de COE"""
         if df is None or df.empty:
             return False, "DataFrame vazio"
         
-        colunas_essenciais = ['Conta', 'Nome', 'Produto', 'Vencimento', 'Valor Bruto']
-        colunas_faltantes = [col for col in colunas_essenciais if col not in df.columns]
+        colunas_faltantes = ParserCOE.COLUNAS_ESSENCIAIS.difference(df.columns)
         
         if colunas_faltantes:
-            return False, f"Colunas faltantes: {', '.join(colunas_faltantes)}"
+            return False, f"Colunas faltantes: {', '.join(sorted(colunas_faltantes))}"
         
         return True, "Estrutura valida"
     
@@ -404,17 +409,18 @@ class ParserRendaVariavel:
         'Valor Bruto'
     ]
     
+    COLUNAS_ESSENCIAIS = frozenset(['Conta', 'Nome', 'Produto', 'Quantidade', 'Valor Bruto'])
+    
     @staticmethod
     def validar_estrutura(df: pd.DataFrame) -> Tuple[bool, str]:
         """Valida se o DataFrame tem a estrutura esperada de Renda Variavel"""
         if df is None or df.empty:
             return False, "DataFrame vazio"
         
-        colunas_essenciais = ['Conta', 'Nome', 'Produto', 'Quantidade', 'Valor Bruto']
-        colunas_faltantes = [col for col in colunas_essenciais if col not in df.columns]
+        colunas_faltantes = ParserRendaVariavel.COLUNAS_ESSENCIAIS.difference(df.columns)
         
         if colunas_faltantes:
-            return False, f"Colunas faltantes: {', '.join(colunas_faltantes)}"
+            return False, f"Colunas faltantes: {', '.join(sorted(colunas_faltantes))}"
         
         return True, "Estrutura valida"
     
@@ -487,6 +493,12 @@ class GerenciadorParsers:
         'renda_variavel': ParserRendaVariavel
     }
     
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _normalizar_tipo(tipo: str) -> str:
+        """Normaliza o nome do tipo de relatório para a chave do registro"""
+        return tipo.lower().replace(' ', '_')
+    
     @staticmethod
     def obter_parser(tipo: str):
         """
@@ -498,7 +510,7 @@ class GerenciadorParsers:
         Returns:
             Classe do parser
         """
-        tipo_lower = tipo.lower().replace(' ', '_')
+        tipo_lower = GerenciadorParsers._normalizar_tipo(tipo)
         if tipo_lower not in GerenciadorParsers.PARSERS:
             raise ValueError(f"Parser não encontrado para tipo: {tipo}")
         return GerenciadorParsers.PARSERS[tipo_lower]
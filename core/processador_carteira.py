@@ -5,15 +5,301 @@ Suporta múltiplas categorias: Renda Fixa, COE, Renda Variável e Derivativos.
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, Tuple, Optional, List
+from pandas.api.types import union_categoricals
+from pandas.io.parsers import TextParser
+from datetime import date, datetime, timedelta
+from typing import Dict, Tuple, Optional, List, Union
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import logging
+import os
+import threading
+from pathlib import Path
+
+try:
+    import python_calamine
+except ImportError:  # pragma: no cover - dependência opcional
+    python_calamine = None
+
+try:
+    import xlsxwriter
+except ImportError:  # pragma: no cover - dependência opcional
+    xlsxwriter = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - dependência opcional
+    pyarrow = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - dependência opcional
+    njit = None
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+VERSAO_PANDAS = tuple(int(p) for p in pd.__version__.split('.')[:2])
+
+# O motor "calamine" só é suportado nativamente pelo pandas a partir da 2.2
+PANDAS_SUPORTA_CALAMINE = VERSAO_PANDAS >= (2, 2)
+
+# Texto em buffers contíguos do Arrow quando disponível, em vez de objetos Python
+DTYPE_TEXTO = 'string[pyarrow]' if pyarrow is not None else 'string'
+
+# Copy-on-Write: colunas novas compartilham os buffers das originais sem cópias
+# defensivas (padrão a partir do pandas 3.0)
+if (2, 0) <= VERSAO_PANDAS < (3, 0):
+    pd.set_option('mode.copy_on_write', True)
+
+# A partir deste número de linhas o kernel compilado compensa o custo de despacho
+LIMIAR_NUMBA = 200_000
+
+
+def _converter_celula_calamine(valor):
+    """
+    Ajusta uma célula do python-calamine ao que o leitor do pandas produz.
+    
+    O calamine devolve todo número como float e datas à meia-noite como date;
+    o pandas devolve int para floats integrais e datetime para datas.
+    """
+    if type(valor) is float:
+        return int(valor) if valor.is_integer() else valor
+    if type(valor) is date:
+        return datetime(valor.year, valor.month, valor.day)
+    return valor
+
+
+def _aba_calamine_para_df(aba, usecols: Optional[List[str]] = None,
+                          nrows: Optional[int] = None, dtype: Optional[Dict] = None) -> pd.DataFrame:
+    """Converte uma aba do python-calamine em DataFrame (primeira linha como cabeçalho)."""
+    linhas = aba.to_python(nrows=nrows + 1 if nrows is not None else None)
+    if not linhas:
+        return pd.DataFrame()
+    
+    dados = [[_converter_celula_calamine(v) for v in linha] for linha in linhas]
+    # O parser do próprio read_excel trata os cabeçalhos (duplicados viram
+    # ".1", vazios "Unnamed: N"), as células vazias e a inferência de tipos
+    return TextParser(dados, header=0, usecols=usecols, dtype=dtype, skip_blank_lines=False).read()
+
+
+def _ler_excel_calamine(arquivo, usecols: Optional[List[str]] = None,
+                        nrows: Optional[int] = None, dtype: Optional[Dict] = None,
+                        sheet_name: Union[str, int, None] = 0) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    Lê abas de um arquivo Excel diretamente com python-calamine.
+    
+    Usado quando a versão instalada do pandas ainda não aceita engine="calamine".
+    
+    Args:
+        arquivo: Caminho ou objeto do arquivo Excel
+        usecols: Colunas a manter (None para todas)
+        nrows: Número de linhas de dados a ler (None para todas)
+        dtype: Tipos a aplicar por coluna
+        sheet_name: Nome ou índice da aba; None lê todas
+        
+    Returns:
+        DataFrame com a primeira linha como cabeçalho, ou dicionário
+        {nome da aba: DataFrame} quando sheet_name é None
+    """
+    workbook = python_calamine.CalamineWorkbook.from_object(arquivo)
+    
+    if sheet_name is None:
+        return {
+            nome: _aba_calamine_para_df(workbook.get_sheet_by_name(nome), usecols, nrows, dtype)
+            for nome in workbook.sheet_names
+        }
+    
+    if isinstance(sheet_name, int):
+        aba = workbook.get_sheet_by_index(sheet_name)
+    else:
+        aba = workbook.get_sheet_by_name(sheet_name)
+    return _aba_calamine_para_df(aba, usecols, nrows, dtype)
+
+
+def _ler_csv(arquivo, usecols: Optional[List[str]] = None,
+             nrows: Optional[int] = None, dtype: Optional[Dict] = None) -> pd.DataFrame:
+    """Lê um arquivo CSV com o leitor multithread do pyarrow quando instalado (ele não aceita nrows)."""
+    if pyarrow is not None and nrows is None:
+        return pd.read_csv(arquivo, engine='pyarrow', usecols=usecols, dtype=dtype)
+    return pd.read_csv(arquivo, usecols=usecols, nrows=nrows, dtype=dtype)
+
+
+def _ler_parquet(arquivo, usecols: Optional[List[str]] = None,
+                 nrows: Optional[int] = None, dtype: Optional[Dict] = None) -> pd.DataFrame:
+    """Lê um arquivo Parquet; para nrows=0 basta o esquema, sem decodificar dados."""
+    if nrows == 0:
+        tabela = pyarrow.parquet.read_schema(arquivo).empty_table()
+        df = tabela.select(usecols).to_pandas() if usecols is not None else tabela.to_pandas()
+    else:
+        df = pd.read_parquet(arquivo, engine='pyarrow', columns=usecols)
+        if nrows is not None:
+            df = df.head(nrows)
+    return df.astype(dtype) if dtype else df
+
+
+def ler_excel(arquivo, engine: Optional[str] = None, usecols: Optional[List[str]] = None,
+              nrows: Optional[int] = None, dtype: Optional[Dict] = None,
+              sheet_name: Union[str, int, None] = 0) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    Lê um arquivo Excel com o motor solicitado.
+    
+    Se o motor "calamine" for pedido mas não estiver disponível, recorre ao
+    motor padrão do pandas (openpyxl). Caminhos terminados em .csv ou .parquet
+    são lidos com pd.read_csv / pd.read_parquet, tratados como uma planilha de
+    aba única.
+    
+    Args:
+        arquivo: Caminho ou objeto do arquivo Excel (ou caminho de um CSV ou Parquet)
+        engine: Motor de leitura ("calamine", "openpyxl" ou None para o padrão)
+        usecols: Colunas a ler (None para todas)
+        nrows: Número de linhas de dados a ler (None para todas)
+        dtype: Tipos a aplicar por coluna
+        sheet_name: Nome ou índice da aba; None lê todas
+        
+    Returns:
+        DataFrame lido, ou dicionário {nome da aba: DataFrame} quando
+        sheet_name é None
+    """
+    # Objetos de arquivo (ex.: uploads do Streamlit) podem ser lidos mais de uma vez
+    if hasattr(arquivo, 'seek'):
+        arquivo.seek(0)
+    
+    if isinstance(arquivo, (str, os.PathLike)):
+        extensao = Path(arquivo).suffix.lower()
+        if extensao in ('.csv', '.parquet'):
+            if extensao == '.csv':
+                df = _ler_csv(arquivo, usecols=usecols, nrows=nrows, dtype=dtype)
+            else:
+                df = _ler_parquet(arquivo, usecols=usecols, nrows=nrows, dtype=dtype)
+            return {Path(arquivo).stem: df} if sheet_name is None else df
+    
+    if engine == 'calamine':
+        if python_calamine is None:
+            engine = None
+        elif not PANDAS_SUPORTA_CALAMINE:
+            return _ler_excel_calamine(arquivo, usecols=usecols, nrows=nrows, dtype=dtype,
+                                       sheet_name=sheet_name)
+    
+    return pd.read_excel(arquivo, engine=engine, usecols=usecols, nrows=nrows, dtype=dtype,
+                         sheet_name=sheet_name)
+
+
+def _escrever_xlsx_streaming(caminho_saida: str, abas: List[Tuple[str, pd.DataFrame]]):
+    """
+    Grava as abas em um arquivo Excel com xlsxwriter em modo constant_memory.
+    
+    Nesse modo cada linha é descarregada em disco assim que a próxima começa,
+    então as células precisam ser escritas linha a linha (o to_excel do pandas
+    escreve coluna a coluna e perderia dados).
+    
+    Args:
+        caminho_saida: Caminho do arquivo a gerar
+        abas: Lista de (nome da aba, DataFrame)
+    """
+    workbook = xlsxwriter.Workbook(caminho_saida, {'constant_memory': True, 'nan_inf_to_errors': True})
+    try:
+        formato_cabecalho = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+        formato_data = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+        
+        for nome_aba, df in abas:
+            aba = workbook.add_worksheet(nome_aba)
+            aba.write_row(0, 0, [str(col) for col in df.columns], formato_cabecalho)
+            
+            # Valores ausentes (NaN, NaT, pd.NA) viram células vazias
+            linhas = df.astype(object).where(df.notna(), None)
+            for i, linha in enumerate(linhas.itertuples(index=False, name=None), start=1):
+                for j, valor in enumerate(linha):
+                    if valor is None:
+                        continue
+                    if isinstance(valor, datetime):
+                        aba.write_datetime(i, j, valor, formato_data)
+                    else:
+                        aba.write(i, j, valor)
+    finally:
+        workbook.close()
+
+
+def _copiar_resultado(valor):
+    """
+    Copia um resultado em cache antes de entregá-lo a quem chamou.
+    
+    DataFrames recebem cópia rasa (barata com Copy-on-Write), inclusive dentro
+    de tuplas; dicionários são copiados. Assim alterações feitas por quem
+    recebe o resultado não chegam ao cache.
+    """
+    if isinstance(valor, pd.DataFrame):
+        return valor.copy(deep=False)
+    if isinstance(valor, tuple):
+        return tuple(_copiar_resultado(item) for item in valor)
+    if isinstance(valor, dict):
+        return dict(valor)
+    return valor
+
+
+def _em_cache(metodo):
+    """
+    Memoiza o resultado de um método de consulta do ProcessadorCarteira.
+    
+    O cache é descartado sempre que a carteira consolidada é recalculada,
+    limpa ou substituída. Cada chamada recebe uma cópia do resultado
+    guardado (ver _copiar_resultado).
+    """
+    @functools.wraps(metodo)
+    def wrapper(self, *args, **kwargs):
+        versao = (self._versao, id(self.carteira_consolidada))
+        if self._versao_cache != versao:
+            self._cache.clear()
+            self._versao_cache = versao
+        
+        chave = (metodo.__name__, args, tuple(sorted(kwargs.items())))
+        if chave not in self._cache:
+            self._cache[chave] = metodo(self, *args, **kwargs)
+        return _copiar_resultado(self._cache[chave])
+    
+    return wrapper
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _classificar_vencimentos(vencimentos, hoje):
+        """
+        Calcula dias para vencer e o código de status em uma única passada.
+        
+        Os códigos seguem a ordem de ProcessadorCarteira.STATUS_VENCIMENTO:
+        0=Sem Vencimento, 1=VENCIDO, 2=CRÍTICO, 3=ALERTA, 4=OK.
+        
+        Args:
+            vencimentos: Datas de vencimento em dias desde a época (int64, NaT = mínimo int64)
+            hoje: Data atual em dias desde a época
+            
+        Returns:
+            Tupla (dias int32, códigos int8)
+        """
+        n = vencimentos.shape[0]
+        nat = np.iinfo(np.int64).min
+        dias = np.zeros(n, dtype=np.int32)
+        codigos = np.zeros(n, dtype=np.int8)
+        for i in prange(n):
+            if vencimentos[i] == nat:
+                continue
+            d = vencimentos[i] - hoje
+            dias[i] = d
+            if d < 0:
+                codigos[i] = 1
+            elif d <= 30:
+                codigos[i] = 2
+            elif d <= 60:
+                codigos[i] = 3
+            else:
+                codigos[i] = 4
+        return dias, codigos
+else:
+    _classificar_vencimentos = None
+
 
 class CategoriaInvestimento(Enum):
     """Categorias de investimento suportadas."""
@@ -23,6 +309,16 @@ class CategoriaInvestimento(Enum):
     DERIVATIVOS = "Derivativos"
 
 
+# Categorias em ordem alfabética, usadas como categorias da coluna 'Categoria'
+CATEGORIAS = sorted(c.value for c in CategoriaInvestimento)
+
+# Colunas mantidas de cada categoria carregada, na ordem usada na consolidação
+COLUNAS_CARTEIRA = ['Ativo', 'Categoria', 'Classe', 'Valor', 'Data Vencimento']
+
+# Tipo da coluna 'Data Vencimento'
+DTYPE_DATA = 'datetime64[s]'
+
+
 class ConfiguracaoCategoria:
     """Configuração de processamento para cada categoria de investimento."""
     
@@ -88,58 +384,129 @@ class ValidadorDados:
         return True, "Validação bem-sucedida"
     
     @staticmethod
-    def validar_coluna_valor(df: pd.DataFrame, coluna_valor: str) -> Tuple[bool, str]:
+    def validar_coluna_valor(df: pd.DataFrame, coluna_valor: str,
+                             sample_size: int = 20_000) -> Tuple[bool, str, Optional[pd.Series]]:
         """
         Valida se a coluna de valor existe e contém dados numéricos válidos.
         
+        Em tabelas com mais de 50.000 linhas a taxa de valores numéricos é
+        estimada sobre uma amostra de sample_size linhas.
+        
         Args:
             df: DataFrame a validar
             coluna_valor: Nome da coluna de valor
+            sample_size: Tamanho da amostra usada em tabelas grandes
             
         Returns:
-            Tupla (válido, mensagem)
+            Tupla (válido, mensagem, valores numéricos). Os valores convertidos
+            só são devolvidos quando a coluna inteira foi analisada; caso
+            contrário vêm como None.
         """
         if coluna_valor not in df.columns:
-            return False, f"Coluna de valor '{coluna_valor}' não encontrada"
+            return False, f"Coluna de valor '{coluna_valor}' não encontrada", None
+        
+        coluna = df[coluna_valor]
+        amostrado = len(coluna) > 50_000
+        if amostrado:
+            coluna = coluna.sample(n=min(sample_size, len(coluna)), random_state=0)
         
         # Tentar converter para numérico
-        valores_numericos = pd.to_numeric(df[coluna_valor], errors='coerce')
-        taxa_validos = valores_numericos.notna().sum() / len(df)
+        valores_numericos = pd.to_numeric(coluna, errors='coerce')
+        taxa_validos = valores_numericos.notna().sum() / len(coluna) if len(coluna) else 0
+        
+        if amostrado:
+            valores_numericos = None
         
         if taxa_validos < 0.5:
-            return False, f"Menos de 50% dos valores são numéricos válidos"
+            return False, f"Menos de 50% dos valores são numéricos válidos", valores_numericos
         
-        return True, "Coluna de valor validada"
+        return True, "Coluna de valor validada", valores_numericos
 
 
 class ProcessadorCarteira:
     """Classe principal para processar relatórios de investimentos."""
     
-    def __init__(self):
-        """Inicializa o processador de carteira."""
+    # Status de vencimento possíveis, usados como categorias da coluna
+    STATUS_VENCIMENTO = [
+        "Sem Vencimento", "VENCIDO", "CRÍTICO (≤ 30 dias)", "ALERTA (31-60 dias)", "OK"
+    ]
+    
+    def __init__(self, engine: Optional[str] = "calamine"):
+        """
+        Inicializa o processador de carteira.
+        
+        Args:
+            engine: Motor de leitura do Excel. "calamine" (padrão) usa o leitor
+                em Rust quando instalado; None usa o padrão do pandas.
+        """
+        self.engine = engine
         self.dados_processados: Dict[str, pd.DataFrame] = {}
         self.carteira_consolidada: Optional[pd.DataFrame] = None
         self.validador = ValidadorDados()
         self.data_processamento = datetime.now()
+        # Cache dos resultados das consultas sobre a carteira consolidada
+        self._versao = 0
+        self._versao_cache = None
+        self._cache: Dict = {}
+        # Protege dados_processados em carregamentos paralelos
+        self._lock = threading.Lock()
     
-    def carregar_categoria(self, arquivo, categoria: CategoriaInvestimento) -> Tuple[bool, str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _resolver_coluna_valor(categoria: CategoriaInvestimento, colunas: Tuple) -> str:
+        """
+        Resolve a coluna de valor de uma categoria a partir do cabeçalho do arquivo.
+        
+        Usa a coluna configurada ou, na falta dela, a primeira que contenha
+        "valor" no nome. O resultado fica em cache por (categoria, cabeçalho).
+        
+        Args:
+            categoria: Categoria de investimento
+            colunas: Colunas do arquivo, na ordem original
+            
+        Returns:
+            Nome da coluna de valor ('Valor' se nenhuma for encontrada)
+        """
+        coluna_valor = ConfiguracaoCategoria.obter_config(categoria).get('coluna_valor', 'Valor')
+        if coluna_valor in colunas:
+            return coluna_valor
+        
+        # Tentar alternativas
+        colunas_alternativas = [col for col in colunas if 'valor' in str(col).lower()]
+        return colunas_alternativas[0] if colunas_alternativas else 'Valor'
+    
+    def carregar_categoria(self, arquivo, categoria: CategoriaInvestimento,
+                           aba: Union[str, int] = 0) -> Tuple[bool, str]:
         """
         Carrega e processa arquivo de uma categoria de investimento.
         
         Args:
             arquivo: Caminho ou objeto do arquivo Excel
             categoria: Categoria de investimento
+            aba: Nome ou índice da aba com os dados da categoria
             
         Returns:
             Tupla (sucesso, mensagem)
         """
         try:
-            # Ler arquivo
-            df = pd.read_excel(arquivo)
-            
             # Obter configuração
             config = ConfiguracaoCategoria.obter_config(categoria)
             coluna_ativo = config.get('coluna_ativo', 'Ativo')
+            coluna_classe = config.get('coluna_classe', 'Tipo')
+            
+            # Ler apenas o cabeçalho para resolver as colunas necessárias
+            colunas_arquivo = list(ler_excel(arquivo, self.engine, nrows=0, sheet_name=aba).columns)
+            
+            coluna_valor = self._resolver_coluna_valor(categoria, tuple(colunas_arquivo))
+            
+            colunas_necessarias = [coluna_ativo, coluna_valor, coluna_classe]
+            if config.get('tem_vencimento', False):
+                colunas_necessarias.append('Data Vencimento')
+            colunas_necessarias = [col for col in dict.fromkeys(colunas_necessarias) if col in colunas_arquivo]
+            
+            # Ler arquivo apenas com as colunas usadas
+            tipos = {coluna_ativo: DTYPE_TEXTO} if coluna_ativo in colunas_necessarias else None
+            df = ler_excel(arquivo, self.engine, usecols=colunas_necessarias, dtype=tipos, sheet_name=aba)
             
             # Validar dados básicos
             valido, msg = self.validador.validar_dataframe(df, coluna_ativo)
@@ -149,34 +516,39 @@ class ProcessadorCarteira:
             # Limpar dados
             df = df.dropna(subset=[coluna_ativo])
             
-            # Processar coluna de valor
-            coluna_valor = config.get('coluna_valor', 'Valor')
-            if coluna_valor not in df.columns:
-                # Tentar alternativas
-                colunas_alternativas = [col for col in df.columns if 'valor' in col.lower()]
-                if colunas_alternativas:
-                    coluna_valor = colunas_alternativas[0]
-                else:
-                    coluna_valor = 'Valor'
-            
-            df['Valor'] = pd.to_numeric(df.get(coluna_valor, 0), errors='coerce').fillna(0)
+            # Converter a coluna de valor uma única vez, reaproveitando a validação
+            valido, msg, valores = self.validador.validar_coluna_valor(df, coluna_valor)
+            if coluna_valor in df.columns:
+                if not valido:
+                    logger.warning(f"{categoria.value}: {msg}")
+                if valores is None:
+                    valores = pd.to_numeric(df[coluna_valor], errors='coerce')
+                df['Valor'] = valores.fillna(0).astype('float64')
+            else:
+                df['Valor'] = 0.0
             
             # Processar vencimento
-            if config.get('tem_vencimento', False):
-                if 'Data Vencimento' in df.columns:
-                    df['Data Vencimento'] = pd.to_datetime(df['Data Vencimento'], errors='coerce')
-                else:
-                    df['Data Vencimento'] = pd.NaT
+            # (resolução de segundos: a menor aceita pelo pandas 2.x, que não tem 'D')
+            if config.get('tem_vencimento', False) and 'Data Vencimento' in df.columns:
+                df['Data Vencimento'] = pd.to_datetime(
+                    df['Data Vencimento'], errors='coerce'
+                ).astype(DTYPE_DATA)
             else:
-                df['Data Vencimento'] = pd.NaT
+                df['Data Vencimento'] = pd.Series(pd.NaT, index=df.index, dtype=DTYPE_DATA)
             
             # Adicionar metadados
-            df['Categoria'] = categoria.value
-            coluna_classe = config.get('coluna_classe', 'Tipo')
-            df['Classe'] = df.get(coluna_classe, categoria.value)
+            df['Categoria'] = pd.Categorical([categoria.value] * len(df), categories=CATEGORIAS)
+            # Classes como texto (vazios continuam NaN): colunas vazias ou numéricas
+            # gerariam categorias de outro tipo e o union_categoricals falharia
+            classe = pd.Series(df.get(coluna_classe, categoria.value), index=df.index)
+            df['Classe'] = classe.where(classe.isna(), classe.astype(str)).astype(object).astype('category')
+            
+            # Esquema comum a todas as categorias, na mesma ordem, para o concat
+            df = df.rename(columns={coluna_ativo: 'Ativo'})[COLUNAS_CARTEIRA]
             
             # Armazenar dados processados
-            self.dados_processados[categoria.value] = df
+            with self._lock:
+                self.dados_processados[categoria.value] = df
             logger.info(f"{categoria.value} carregado com sucesso. Total: {len(df)} registros")
             
             return True, f"{categoria.value} carregado com sucesso ({len(df)} registros)"
@@ -185,58 +557,91 @@ class ProcessadorCarteira:
             logger.error(f"Erro ao processar {categoria.value}: {str(e)}")
             return False, f"Erro ao processar {categoria.value}: {str(e)}"
     
-    def carregar_renda_fixa(self, arquivo) -> Tuple[bool, str]:
-        """Carrega arquivo de Renda Fixa."""
-        return self.carregar_categoria(arquivo, CategoriaInvestimento.RENDA_FIXA)
+    def carregar_todas(self, arquivos: Dict[CategoriaInvestimento, Union[str, Tuple[str, Union[str, int]]]]
+                       ) -> Dict[CategoriaInvestimento, Tuple[bool, str]]:
+        """
+        Carrega os arquivos de várias categorias em threads simultâneas.
+        
+        Args:
+            arquivos: Dicionário {categoria: arquivo} ou {categoria: (arquivo, aba)},
+                para categorias em abas de uma mesma pasta de trabalho
+            
+        Returns:
+            Dicionário {categoria: (sucesso, mensagem)}
+        """
+        def carregar(item):
+            categoria, arquivo = item
+            arquivo, aba = arquivo if isinstance(arquivo, tuple) else (arquivo, 0)
+            return self.carregar_categoria(arquivo, categoria, aba)
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            resultados = dict(zip(arquivos.keys(), executor.map(carregar, arquivos.items())))
+        
+        # As threads terminam em qualquer ordem; manter a ordem recebida
+        for categoria in arquivos:
+            if categoria.value in self.dados_processados:
+                self.dados_processados[categoria.value] = self.dados_processados.pop(categoria.value)
+        
+        return resultados
+    
+    def carregar_renda_fixa(self, arquivo, aba: Union[str, int] = 0) -> Tuple[bool, str]:
+        """Carrega arquivo (ou aba) de Renda Fixa."""
+        return self.carregar_categoria(arquivo, CategoriaInvestimento.RENDA_FIXA, aba)
     
-    def carregar_coe(self, arquivo) -> Tuple[bool, str]:
-        """Carrega arquivo de COE."""
-        return self.carregar_categoria(arquivo, CategoriaInvestimento.COE)
+    def carregar_coe(self, arquivo, aba: Union[str, int] = 0) -> Tuple[bool, str]:
+        """Carrega arquivo (ou aba) de COE."""
+        return self.carregar_categoria(arquivo, CategoriaInvestimento.COE, aba)
     
-    def carregar_renda_variavel(self, arquivo) -> Tuple[bool, str]:
-        """Carrega arquivo de Renda Variável."""
-        return self.carregar_categoria(arquivo, CategoriaInvestimento.RENDA_VARIAVEL)
+    def carregar_renda_variavel(self, arquivo, aba: Union[str, int] = 0) -> Tuple[bool, str]:
+        """Carrega arquivo (ou aba) de Renda Variável."""
+        return self.carregar_categoria(arquivo, CategoriaInvestimento.RENDA_VARIAVEL, aba)
     
-    def carregar_derivativos(self, arquivo) -> Tuple[bool, str]:
-        """Carrega arquivo de Derivativos."""
-        return self.carregar_categoria(arquivo, CategoriaInvestimento.DERIVATIVOS)
+    def carregar_derivativos(self, arquivo, aba: Union[str, int] = 0) -> Tuple[bool, str]:
+        """Carrega arquivo (ou aba) de Derivativos."""
+        return self.carregar_categoria(arquivo, CategoriaInvestimento.DERIVATIVOS, aba)
     
-    def processar_vencimentos(self, df: pd.DataFrame) -> pd.DataFrame:
+    def processar_vencimentos(self, df: pd.DataFrame, hoje: Optional[np.datetime64] = None) -> pd.DataFrame:
         """
         Adiciona informações de vencimento ao dataframe.
         
         Args:
             df: DataFrame a processar
+            hoje: Data de referência (datetime64[D]); None usa a data atual
             
         Returns:
             DataFrame com colunas de vencimento adicionadas
         """
-        df = df.copy()
-        hoje = datetime.now()
+        if hoje is None:
+            hoje = np.datetime64(datetime.now().date(), 'D')
         
         if 'Data Vencimento' in df.columns:
-            # Calcular dias para vencer
-            df['Dias para Vencer'] = (df['Data Vencimento'] - hoje).dt.days
+            # Calcular dias para vencer em dias corridos
+            vencimentos = df['Data Vencimento'].to_numpy(dtype='datetime64[D]')
             
-            # Definir status de vencimento
-            def definir_status(dias):
-                if pd.isna(dias):
-                    return "Sem Vencimento"
-                elif dias < 0:
-                    return "VENCIDO"
-                elif dias <= 30:
-                    return "CRÍTICO (≤ 30 dias)"
-                elif dias <= 60:
-                    return "ALERTA (31-60 dias)"
-                else:
-                    return "OK"
-            
-            df['Status Vencimento'] = df['Dias para Vencer'].apply(definir_status)
+            if _classificar_vencimentos is not None and len(df) > LIMIAR_NUMBA:
+                # Carteiras muito grandes: dias e status em um único laço compilado
+                dias, codigos = _classificar_vencimentos(
+                    vencimentos.view('int64'), hoje.astype('int64')
+                )
+            else:
+                sem_data = np.isnat(vencimentos)
+                dias = (vencimentos - hoje).astype('int64')
+                dias[sem_data] = 0
+                dias = dias.astype('int32')
+                
+                # Códigos na ordem de STATUS_VENCIMENTO
+                condicoes = [sem_data, dias < 0, dias <= 30, dias <= 60]
+                codigos = np.select(condicoes, [0, 1, 2, 3], default=4).astype('int8')
         else:
-            df['Dias para Vencer'] = np.nan
-            df['Status Vencimento'] = "Sem Vencimento"
-        
-        return df
+            dias = np.zeros(len(df), dtype='int32')
+            codigos = np.zeros(len(df), dtype='int8')
+        
+        # Uma única alocação: o DataFrame de entrada não é modificado.
+        # Ativos sem vencimento (código 0) ficam com pd.NA em 'Dias para Vencer'
+        return df.assign(**{
+            'Dias para Vencer': pd.arrays.IntegerArray(dias, codigos == 0),
+            'Status Vencimento': pd.Categorical.from_codes(codigos, categories=self.STATUS_VENCIMENTO)
+        })
     
     def consolidar_carteira(self) -> Optional[pd.DataFrame]:
         """
@@ -249,16 +654,59 @@ class ProcessadorCarteira:
             logger.warning("Nenhum dado processado para consolidar")
             return None
         
+        # Mesma data de referência para todas as categorias
+        hoje = np.datetime64(datetime.now().date(), 'D')
+        
         dfs = []
         for categoria, df in self.dados_processados.items():
-            df_proc = self.processar_vencimentos(df.copy())
+            df_proc = self.processar_vencimentos(df, hoje)
             dfs.append(df_proc)
         
-        self.carteira_consolidada = pd.concat(dfs, ignore_index=True)
+        # Unificar as categorias de 'Classe' para que o concat preserve o dtype categórico
+        classes = union_categoricals(
+            [df['Classe'].astype('category') for df in dfs], sort_categories=True
+        ).categories
+        dfs = [df.assign(Classe=df['Classe'].astype(pd.CategoricalDtype(classes))) for df in dfs]
+        
+        # Esquemas já alinhados: o concat reaproveita os buffers sem reordenar colunas
+        self.carteira_consolidada = pd.concat(dfs, ignore_index=True, copy=False, sort=False)
+        self._versao += 1
         logger.info(f"Carteira consolidada com {len(self.carteira_consolidada)} registros")
         
         return self.carteira_consolidada
     
+    @_em_cache
+    def _agregar_por_classe(self) -> pd.DataFrame:
+        """
+        Soma e contagem de valores por (Categoria, Classe).
+        
+        Base comum dos resumos por categoria e por classe, calculada uma vez.
+        Classes ausentes (NaN) são mantidas para que os totais por categoria
+        fiquem completos.
+        """
+        return self.carteira_consolidada.groupby(
+            ['Categoria', 'Classe'], sort=False, observed=True, dropna=False
+        )['Valor'].agg(**{'Valor Total': 'sum', 'Quantidade': 'count'})
+    
+    @_em_cache
+    def _valor_total(self) -> float:
+        """Valor total da carteira, somado direto da coluna 'Valor'."""
+        return float(self.carteira_consolidada['Valor'].to_numpy().sum())
+    
+    @_em_cache
+    def _carteira_por_vencimento(self) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Ordena a carteira uma única vez por dias para vencer.
+        
+        Returns:
+            Tupla (carteira ordenada com NaN ao final, array de dias ordenado)
+        """
+        ordenada = self.carteira_consolidada.sort_values(
+            'Dias para Vencer', na_position='last', kind='stable'
+        )
+        return ordenada, ordenada['Dias para Vencer'].to_numpy(dtype='float64', na_value=np.nan)
+    
+    @_em_cache
     def obter_resumo_alocacao(self) -> Optional[Tuple[pd.DataFrame, float]]:
         """
         Retorna resumo de alocação por categoria.
@@ -270,17 +718,15 @@ class ProcessadorCarteira:
             logger.warning("Carteira não consolidada")
             return None
         
-        alocacao = self.carteira_consolidada.groupby('Categoria')['Valor'].agg([
-            ('Valor Total', 'sum'),
-            ('Quantidade', 'count')
-        ]).reset_index()
+        alocacao = self._agregar_por_classe().groupby(level='Categoria', sort=False, observed=True).sum()
         
-        total = alocacao['Valor Total'].sum()
-        alocacao['Percentual'] = (alocacao['Valor Total'] / total * 100).round(2)
-        alocacao = alocacao.sort_values('Percentual', ascending=False)
+        total = self._valor_total()
+        alocacao['Percentual'] = alocacao['Valor Total'].div(total).mul(100).round(2)
+        alocacao.sort_values(['Percentual', 'Categoria'], ascending=[False, True], inplace=True)
         
-        return alocacao, total
+        return alocacao.reset_index(), total
     
+    @_em_cache
     def obter_resumo_por_classe(self) -> Optional[pd.DataFrame]:
         """
         Retorna resumo de alocação por classe dentro de cada categoria.
@@ -291,17 +737,19 @@ class ProcessadorCarteira:
         if self.carteira_consolidada is None:
             return None
         
-        resumo = self.carteira_consolidada.groupby(['Categoria', 'Classe'])['Valor'].agg([
-            ('Valor Total', 'sum'),
-            ('Quantidade', 'count')
-        ]).reset_index()
+        agregado = self._agregar_por_classe()
+        resumo = agregado[agregado.index.get_level_values('Classe').notna()]
         
+        # O total exclui as linhas sem classe para que os percentuais somem 100%
         total = resumo['Valor Total'].sum()
-        resumo['Percentual'] = (resumo['Valor Total'] / total * 100).round(2)
-        resumo = resumo.sort_values(['Categoria', 'Percentual'], ascending=[True, False])
+        resumo['Percentual'] = resumo['Valor Total'].div(total).mul(100).round(2)
+        resumo.sort_values(
+            ['Categoria', 'Percentual', 'Classe'], ascending=[True, False, True], inplace=True
+        )
         
-        return resumo
+        return resumo.reset_index()
     
+    @_em_cache
     def obter_alertas_vencimento(self, dias_alerta: int = 60) -> Optional[pd.DataFrame]:
         """
         Retorna ativos com vencimento próximo.
@@ -315,13 +763,14 @@ class ProcessadorCarteira:
         if self.carteira_consolidada is None:
             return None
         
-        alertas = self.carteira_consolidada[
-            (self.carteira_consolidada['Dias para Vencer'] <= dias_alerta) & 
-            (self.carteira_consolidada['Dias para Vencer'] >= 0)
-        ].sort_values('Dias para Vencer')
+        ordenada, dias = self._carteira_por_vencimento()
+        inicio = np.searchsorted(dias, 0, side='left')
+        fim = np.searchsorted(dias, dias_alerta, side='right')
+        alertas = ordenada.iloc[inicio:fim]
         
         return alertas if not alertas.empty else None
     
+    @_em_cache
     def obter_ativos_vencidos(self) -> Optional[pd.DataFrame]:
         """
         Retorna ativos vencidos.
@@ -332,12 +781,12 @@ class ProcessadorCarteira:
         if self.carteira_consolidada is None:
             return None
         
-        vencidos = self.carteira_consolidada[
-            self.carteira_consolidada['Dias para Vencer'] < 0
-        ].sort_values('Dias para Vencer')
+        ordenada, dias = self._carteira_por_vencimento()
+        vencidos = ordenada.iloc[:np.searchsorted(dias, 0, side='left')]
         
         return vencidos if not vencidos.empty else None
     
+    @_em_cache
     def obter_carteira_detalhada(self) -> Optional[pd.DataFrame]:
         """
         Retorna a carteira consolidada com informações detalhadas.
@@ -345,7 +794,8 @@ class ProcessadorCarteira:
         Returns:
             DataFrame com carteira detalhada ou None
         """
-        if self.carteira_consolidada is None:
+        carteira = self.carteira_consolidada
+        if carteira is None:
             return None
         
         colunas_exibicao = [
@@ -354,13 +804,14 @@ class ProcessadorCarteira:
         ]
         
         # Manter apenas colunas que existem
-        colunas_exibicao = [col for col in colunas_exibicao if col in self.carteira_consolidada.columns]
+        colunas_exibicao = [col for col in colunas_exibicao if col in carteira.columns]
         
-        df_exibicao = self.carteira_consolidada[colunas_exibicao].copy()
-        df_exibicao = df_exibicao.sort_values('Dias para Vencer', na_position='last')
+        ordenada, _ = self._carteira_por_vencimento()
+        df_exibicao = ordenada[colunas_exibicao]
         
         return df_exibicao
     
+    @_em_cache
     def obter_estatisticas(self) -> Optional[Dict]:
         """
         Retorna estatísticas gerais da carteira.
@@ -368,19 +819,62 @@ class ProcessadorCarteira:
         Returns:
             Dicionário com estatísticas ou None
         """
-        if self.carteira_consolidada is None:
+        carteira = self.carteira_consolidada
+        if carteira is None:
             return None
         
+        valores = carteira['Valor']
         return {
-            'total_ativos': len(self.carteira_consolidada),
-            'valor_total': self.carteira_consolidada['Valor'].sum(),
-            'valor_medio': self.carteira_consolidada['Valor'].mean(),
-            'valor_maximo': self.carteira_consolidada['Valor'].max(),
-            'valor_minimo': self.carteira_consolidada['Valor'].min(),
-            'categorias': self.carteira_consolidada['Categoria'].nunique(),
+            'total_ativos': len(carteira),
+            'valor_total': self._valor_total(),
+            'valor_medio': valores.mean(),
+            'valor_maximo': valores.max(),
+            'valor_minimo': valores.min(),
+            'categorias': carteira['Categoria'].nunique(),
             'data_processamento': self.data_processamento
         }
     
+    def _tabelas_exportacao(self) -> List[Tuple[str, str, pd.DataFrame]]:
+        """
+        Reúne as tabelas exportadas pela carteira.
+        
+        Returns:
+            Lista de (nome do arquivo, nome da aba, DataFrame), omitindo tabelas vazias
+        """
+        tabelas = []
+        
+        # Aba 1: Resumo de Alocação
+        alocacao, total = self.obter_resumo_alocacao()
+        if alocacao is not None:
+            tabelas.append(('alocacao', 'Resumo Alocação', alocacao))
+        
+        # Aba 2: Resumo por Classe
+        resumo_classe = self.obter_resumo_por_classe()
+        if resumo_classe is not None:
+            tabelas.append(('resumo_classe', 'Resumo por Classe', resumo_classe))
+        
+        # Aba 3: Carteira Detalhada
+        carteira_det = self.obter_carteira_detalhada()
+        if carteira_det is not None:
+            tabelas.append(('carteira_det', 'Carteira Detalhada', carteira_det))
+        
+        # Aba 4: Alertas de Vencimento
+        alertas = self.obter_alertas_vencimento()
+        if alertas is not None:
+            tabelas.append(('alertas', 'Alertas Vencimento', alertas))
+        
+        # Aba 5: Ativos Vencidos
+        vencidos = self.obter_ativos_vencidos()
+        if vencidos is not None:
+            tabelas.append(('vencidos', 'Ativos Vencidos', vencidos))
+        
+        # Aba 6: Estatísticas
+        stats = self.obter_estatisticas()
+        if stats:
+            tabelas.append(('stats', 'Estatísticas', pd.DataFrame([stats])))
+        
+        return tabelas
+    
     def exportar_para_excel(self, caminho_saida: str) -> Tuple[bool, str]:
         """
         Exporta todos os dados para um arquivo Excel com múltiplas abas.
@@ -395,37 +889,14 @@ class ProcessadorCarteira:
             return False, "Carteira não consolidada. Processe os dados primeiro."
         
         try:
-            with pd.ExcelWriter(caminho_saida, engine='openpyxl') as writer:
-                # Aba 1: Resumo de Alocação
-                alocacao, total = self.obter_resumo_alocacao()
-                if alocacao is not None:
-                    alocacao.to_excel(writer, sheet_name='Resumo Alocação', index=False)
-                
-                # Aba 2: Resumo por Classe
-                resumo_classe = self.obter_resumo_por_classe()
-                if resumo_classe is not None:
-                    resumo_classe.to_excel(writer, sheet_name='Resumo por Classe', index=False)
-                
-                # Aba 3: Carteira Detalhada
-                carteira_det = self.obter_carteira_detalhada()
-                if carteira_det is not None:
-                    carteira_det.to_excel(writer, sheet_name='Carteira Detalhada', index=False)
-                
-                # Aba 4: Alertas de Vencimento
-                alertas = self.obter_alertas_vencimento()
-                if alertas is not None:
-                    alertas.to_excel(writer, sheet_name='Alertas Vencimento', index=False)
-                
-                # Aba 5: Ativos Vencidos
-                vencidos = self.obter_ativos_vencidos()
-                if vencidos is not None:
-                    vencidos.to_excel(writer, sheet_name='Ativos Vencidos', index=False)
-                
-                # Aba 6: Estatísticas
-                stats = self.obter_estatisticas()
-                if stats:
-                    stats_df = pd.DataFrame([stats])
-                    stats_df.to_excel(writer, sheet_name='Estatísticas', index=False)
+            abas = [(nome_aba, df) for _, nome_aba, df in self._tabelas_exportacao()]
+            
+            if xlsxwriter is not None:
+                _escrever_xlsx_streaming(caminho_saida, abas)
+            else:
+                with pd.ExcelWriter(caminho_saida, engine='openpyxl') as writer:
+                    for nome_aba, df in abas:
+                        df.to_excel(writer, sheet_name=nome_aba, index=False)
             
             logger.info(f"Arquivo exportado com sucesso: {caminho_saida}")
             return True, f"Arquivo exportado com sucesso: {caminho_saida}"
@@ -434,8 +905,48 @@ class ProcessadorCarteira:
             logger.error(f"Erro ao exportar: {str(e)}")
             return False, f"Erro ao exportar: {str(e)}"
     
+    def exportar_para_parquet(self, dir_saida: str) -> Tuple[bool, str]:
+        """
+        Exporta as mesmas tabelas do Excel como arquivos Parquet (pyarrow + snappy).
+        
+        Cada tabela vira um arquivo em dir_saida: alocacao.parquet,
+        resumo_classe.parquet, carteira_det.parquet, alertas.parquet,
+        vencidos.parquet e stats.parquet.
+        
+        Args:
+            dir_saida: Diretório onde os arquivos serão gravados
+            
+        Returns:
+            Tupla (sucesso, mensagem)
+        """
+        if self.carteira_consolidada is None:
+            return False, "Carteira não consolidada. Processe os dados primeiro."
+        
+        try:
+            os.makedirs(dir_saida, exist_ok=True)
+            
+            for nome_arquivo, _, df in self._tabelas_exportacao():
+                # Colunas de texto vão como strings Arrow; categóricas já viram dicionário
+                colunas_texto = [
+                    col for col in ('Ativo', 'Classe')
+                    if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype)
+                ]
+                if colunas_texto:
+                    df = df.astype({col: 'string[pyarrow]' for col in colunas_texto})
+                
+                caminho = os.path.join(dir_saida, f"{nome_arquivo}.parquet")
+                df.to_parquet(caminho, engine='pyarrow', compression='snappy')
+            
+            logger.info(f"Arquivos Parquet exportados com sucesso: {dir_saida}")
+            return True, f"Arquivos Parquet exportados com sucesso: {dir_saida}"
+        
+        except Exception as e:
+            logger.error(f"Erro ao exportar Parquet: {str(e)}")
+            return False, f"Erro ao exportar Parquet: {str(e)}"
+    
     def limpar_dados(self):
         """Limpa todos os dados processados."""
         self.dados_processados = {}
         self.carteira_consolidada = None
+        self._versao += 1
         logger.info("Dados limpos")
@@ -0,0 +1,194 @@
+"""
+Processador de carteira com pipeline preguiçoso (LazyFrame) do Polars.
+Indicado para carteiras grandes: leitura, limpeza, cálculo de vencimentos e
+consolidação são executados em uma única consulta otimizada.
+"""
+
+import pandas as pd
+from datetime import date
+from typing import Dict, Tuple, Optional, Union
+from pathlib import Path
+import logging
+import os
+
+from .processador_carteira import (
+    ProcessadorCarteira,
+    CategoriaInvestimento,
+    ConfiguracaoCategoria,
+    CATEGORIAS,
+    DTYPE_DATA
+)
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - dependência opcional
+    pl = None
+
+logger = logging.getLogger(__name__)
+
+
+def _coletar(consulta: "pl.LazyFrame") -> "pl.DataFrame":
+    """Executa a consulta no motor de streaming do Polars."""
+    try:
+        return consulta.collect(engine='streaming')
+    except TypeError:
+        # Versões anteriores à 1.0 usam o argumento streaming
+        return consulta.collect(streaming=True)
+
+
+class ProcessadorCarteiraPolars(ProcessadorCarteira):
+    """
+    Variante do ProcessadorCarteira que monta o pipeline em Polars.
+    
+    As categorias carregadas ficam como LazyFrames; a consolidação junta todas,
+    calcula os vencimentos e só então materializa o resultado, convertido para
+    pandas para que os métodos obter_* e de exportação funcionem sem mudanças.
+    """
+    
+    def __init__(self):
+        """Inicializa o processador. Requer o pacote polars instalado."""
+        if pl is None:
+            raise ImportError("ProcessadorCarteiraPolars requer o pacote 'polars'")
+        
+        super().__init__(engine='calamine')
+        self.consultas: Dict[str, "pl.LazyFrame"] = {}
+    
+    def carregar_categoria(self, arquivo, categoria: CategoriaInvestimento,
+                           aba: Union[str, int] = 0) -> Tuple[bool, str]:
+        """
+        Lê o arquivo de uma categoria e registra sua consulta preguiçosa.
+        
+        Args:
+            arquivo: Caminho ou objeto do arquivo Excel (ou caminho de um CSV ou Parquet)
+            categoria: Categoria de investimento
+            aba: Nome ou índice da aba com os dados da categoria
+        
+        Returns:
+            Tupla (sucesso, mensagem)
+        """
+        try:
+            extensao = Path(arquivo).suffix.lower() if isinstance(arquivo, (str, os.PathLike)) else ''
+            if extensao == '.parquet':
+                df = pl.read_parquet(arquivo)
+            elif extensao == '.csv':
+                df = pl.read_csv(arquivo)
+            # O Polars numera as abas a partir de 1
+            elif isinstance(aba, str):
+                df = pl.read_excel(arquivo, engine='calamine', sheet_name=aba)
+            else:
+                df = pl.read_excel(arquivo, engine='calamine', sheet_id=aba + 1)
+            
+            # Obter configuração
+            config = ConfiguracaoCategoria.obter_config(categoria)
+            coluna_ativo = config.get('coluna_ativo', 'Ativo')
+            coluna_classe = config.get('coluna_classe', 'Tipo')
+            
+            # Validar dados básicos
+            if df.is_empty():
+                return False, f"Erro ao processar {categoria.value}: Arquivo vazio ou inválido"
+            if coluna_ativo not in df.columns:
+                return False, f"Erro ao processar {categoria.value}: Coluna '{coluna_ativo}' não encontrada no arquivo"
+            
+            total_registros = df.height - df.get_column(coluna_ativo).null_count()
+            if total_registros == 0:
+                return False, f"Erro ao processar {categoria.value}: Nenhum ativo válido encontrado após limpeza"
+            
+            # Processar coluna de valor
+            coluna_valor = self._resolver_coluna_valor(categoria, tuple(df.columns))
+            if coluna_valor in df.columns:
+                valor = pl.col(coluna_valor).cast(pl.Float64, strict=False).fill_null(0.0)
+            else:
+                valor = pl.lit(0.0)
+            
+            # Processar vencimento
+            if config.get('tem_vencimento', False) and 'Data Vencimento' in df.columns:
+                if df.schema['Data Vencimento'] == pl.String:
+                    vencimento = pl.col('Data Vencimento').str.to_datetime(strict=False)
+                else:
+                    vencimento = pl.col('Data Vencimento').cast(pl.Datetime, strict=False)
+            else:
+                vencimento = pl.lit(None, dtype=pl.Datetime)
+            
+            if coluna_classe in df.columns:
+                classe = pl.col(coluna_classe).cast(pl.String)
+            else:
+                classe = pl.lit(categoria.value)
+            
+            consulta = (
+                df.lazy()
+                .filter(pl.col(coluna_ativo).is_not_null())
+                .select(
+                    pl.col(coluna_ativo).cast(pl.String).alias('Ativo'),
+                    pl.lit(categoria.value).alias('Categoria'),
+                    classe.alias('Classe'),
+                    valor.alias('Valor'),
+                    vencimento.alias('Data Vencimento')
+                )
+            )
+            with self._lock:
+                self.consultas[categoria.value] = consulta
+            logger.info(f"{categoria.value} carregado com sucesso. Total: {total_registros} registros")
+            
+            return True, f"{categoria.value} carregado com sucesso ({total_registros} registros)"
+        
+        except Exception as e:
+            logger.error(f"Erro ao processar {categoria.value}: {str(e)}")
+            return False, f"Erro ao processar {categoria.value}: {str(e)}"
+    
+    def carregar_todas(self, arquivos: Dict[CategoriaInvestimento, Union[str, Tuple[str, Union[str, int]]]]
+                       ) -> Dict[CategoriaInvestimento, Tuple[bool, str]]:
+        """Carrega várias categorias em paralelo, mantendo a ordem recebida."""
+        resultados = super().carregar_todas(arquivos)
+        for categoria in arquivos:
+            if categoria.value in self.consultas:
+                self.consultas[categoria.value] = self.consultas.pop(categoria.value)
+        return resultados
+    
+    def consolidar_carteira(self) -> Optional[pd.DataFrame]:
+        """
+        Executa a consulta consolidada e converte o resultado para pandas.
+        
+        Returns:
+            DataFrame consolidado ou None se vazio
+        """
+        if not self.consultas:
+            logger.warning("Nenhum dado processado para consolidar")
+            return None
+        
+        dias = pl.col('Dias para Vencer')
+        consulta = (
+            pl.concat(list(self.consultas.values()), how='diagonal_relaxed')
+            .with_columns(
+                (pl.col('Data Vencimento').dt.date() - pl.lit(date.today()))
+                .dt.total_days().cast(pl.Int32).alias('Dias para Vencer')
+            )
+            .with_columns(
+                pl.when(dias.is_null()).then(pl.lit(self.STATUS_VENCIMENTO[0]))
+                .when(dias < 0).then(pl.lit(self.STATUS_VENCIMENTO[1]))
+                .when(dias <= 30).then(pl.lit(self.STATUS_VENCIMENTO[2]))
+                .when(dias <= 60).then(pl.lit(self.STATUS_VENCIMENTO[3]))
+                .otherwise(pl.lit(self.STATUS_VENCIMENTO[4]))
+                .alias('Status Vencimento')
+            )
+        )
+        
+        carteira = _coletar(consulta).to_pandas(use_pyarrow_extension_array=True)
+        
+        # Colunas usadas nos cálculos voltam aos tipos do ProcessadorCarteira
+        self.carteira_consolidada = carteira.astype({
+            'Valor': 'float64',
+            'Dias para Vencer': 'Int32',
+            'Data Vencimento': DTYPE_DATA,
+            'Categoria': pd.CategoricalDtype(CATEGORIAS),
+            'Classe': 'category',
+            'Status Vencimento': pd.CategoricalDtype(self.STATUS_VENCIMENTO)
+        })
+        self._versao += 1
+        logger.info(f"Carteira consolidada com {len(self.carteira_consolidada)} registros")
+        
+        return self.carteira_consolidada
+    
+    def limpar_dados(self):
+        """Limpa todos os dados processados."""
+        self.consultas = {}
+        super().limpar_dados()
@@ -5,13 +5,156 @@ Suporta detecção automática de formato, limpeza de dados e mapeamento de colu
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from datetime import datetime
+from typing import Dict, List, Tuple, Optional, Union
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import re
 
+from .processador_carteira import ler_excel, LIMIAR_NUMBA
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - dependência opcional
+    pyarrow = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - dependência opcional
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Símbolos de moeda e separadores de milhar removidos dos valores em texto
+_RX_MOEDA = re.compile(r'R\$|[$.]')
+
+# Formatos de data aceitos, reconhecidos a partir de um valor de amostra
+_FORMATOS_DATA = [
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}'), '%d/%m/%Y'),
+    (re.compile(r'\d{1,2}-\d{1,2}-\d{4}'), '%d-%m-%Y'),
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}(?:[T ]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?'), '%Y-%m-%d'),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2}'), '%d/%m/%Y %H:%M:%S'),
+    (re.compile(r'\d{1,2}-\d{1,2}-\d{4} \d{1,2}:\d{2}:\d{2}'), '%d-%m-%Y %H:%M:%S'),
+]
+
+
+def _adivinhar_formato_data(amostra) -> Optional[str]:
+    """
+    Identifica o formato de data de um valor de amostra.
+    
+    Args:
+        amostra: Primeiro valor não nulo da coluna
+        
+    Returns:
+        Formato strftime correspondente ou None se não reconhecido
+    """
+    if not isinstance(amostra, str):
+        return None
+    amostra = amostra.strip()
+    for padrao, formato in _FORMATOS_DATA:
+        if padrao.fullmatch(amostra):
+            return formato
+    return None
+
+
+def _compilar_alternativa(padroes: List[str]) -> re.Pattern:
+    """
+    Junta uma lista de padrões em uma única alternância compilada.
+    
+    Os padrões usam o prefixo (?i), que só pode aparecer no início da
+    expressão; ele é removido de cada um e aplicado como re.IGNORECASE.
+    """
+    partes = [padrao[4:] if padrao.startswith('(?i)') else padrao for padrao in padroes]
+    return re.compile('|'.join(f'(?:{parte})' for parte in partes), re.IGNORECASE)
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _converter_brl(codigos, saida, invalidos):
+        """
+        Converte textos no formato brasileiro ("R$ 1.234,56") para float64.
+        
+        Cada linha de codigos traz os code points UCS-4 de um texto (zeros à
+        direita são preenchimento). "R$", "$" e "." são ignorados e a vírgula é
+        o separador decimal. Textos fora do formato simples (espaços internos,
+        expoentes, letras, mais de 15 dígitos) são marcados em invalidos para
+        conversão pelo caminho do pandas.
+        
+        Args:
+            codigos: Matriz uint32 (linhas x largura)
+            saida: Vetor float64 com os valores convertidos (NaN sem dígitos)
+            invalidos: Vetor booleano das linhas não convertidas
+        """
+        n, largura = codigos.shape
+        for i in prange(n):
+            fim = largura
+            while fim > 0 and codigos[i, fim - 1] == 0:
+                fim -= 1
+            
+            # Fases: 0 = espaços iniciais, 1 = após o sinal, 2 = número, 3 = espaços finais
+            fase = 0
+            negativo = False
+            mantissa = 0
+            digitos = 0
+            decimais = -1
+            ok = True
+            j = 0
+            while j < fim:
+                c = codigos[i, j]
+                if c == 82 and j + 1 < fim and codigos[i, j + 1] == 36:  # "R$"
+                    j += 2
+                    continue
+                if c == 36 or c == 46:  # "$" e "."
+                    j += 1
+                    continue
+                espaco = c == 32 or (9 <= c <= 13)
+                if espaco:
+                    if fase == 2:
+                        fase = 3
+                    elif fase == 1:
+                        ok = False
+                        break
+                elif fase == 3:
+                    ok = False
+                    break
+                elif 48 <= c <= 57:
+                    fase = 2
+                    mantissa = mantissa * 10 + (c - 48)
+                    digitos += 1
+                    if decimais >= 0:
+                        decimais += 1
+                elif c == 44 and decimais < 0:  # ","
+                    fase = 2
+                    decimais = 0
+                elif (c == 45 or c == 43) and fase == 0:  # "-" e "+"
+                    fase = 1
+                    negativo = c == 45
+                else:
+                    ok = False
+                    break
+                j += 1
+            
+            if not ok or digitos > 15:
+                invalidos[i] = True
+                saida[i] = np.nan
+            elif digitos == 0:
+                saida[i] = np.nan
+            else:
+                valor = float(mantissa)
+                if decimais > 0:
+                    valor = valor / 10.0 ** decimais
+                saida[i] = -valor if negativo else valor
+else:
+    _converter_brl = None
+
+
+def _tipos_arrow(df: pd.DataFrame) -> pd.DataFrame:
+    """Converte as colunas para tipos do Arrow (texto, números e datas) quando o pyarrow está instalado."""
+    if pyarrow is not None:
+        return df.convert_dtypes(dtype_backend='pyarrow')
+    return df
+
 
 class DetectorColunas:
     """Detecta automaticamente colunas importantes em uma planilha."""
@@ -37,23 +180,32 @@ class DetectorColunas:
         r'(?i)sub.*mercado', r'(?i)segmento$'
     ]
     
+    # Uma expressão por tipo de coluna: cada coluna é testada uma única vez
+    _RX_ATIVO = _compilar_alternativa(PADROES_ATIVO)
+    _RX_VALOR = _compilar_alternativa(PADROES_VALOR)
+    _RX_VENCIMENTO = _compilar_alternativa(PADROES_VENCIMENTO)
+    _RX_CLASSE = _compilar_alternativa(PADROES_CLASSE)
+    
+    _RX_POR_TIPO = {
+        'ativo': _RX_ATIVO,
+        'valor': _RX_VALOR,
+        'vencimento': _RX_VENCIMENTO,
+        'classe': _RX_CLASSE
+    }
+    
     @staticmethod
-    def encontrar_coluna(df: pd.DataFrame, padroes: List[str]) -> Optional[str]:
+    def encontrar_coluna(df: pd.DataFrame, padrao: re.Pattern) -> Optional[str]:
         """
-        Encontra uma coluna que corresponde a um dos padrões.
+        Encontra a primeira coluna que corresponde ao padrão.
         
         Args:
             df: DataFrame para buscar
-            padroes: Lista de padrões regex
+            padrao: Alternância regex compilada com os padrões aceitos
             
         Returns:
             Nome da coluna encontrada ou None
         """
-        for coluna in df.columns:
-            for padrao in padroes:
-                if re.match(padrao, coluna):
-                    return coluna
-        return None
+        return next((coluna for coluna in df.columns if padrao.match(coluna)), None)
     
     @staticmethod
     def detectar_colunas(df: pd.DataFrame) -> Dict[str, Optional[str]]:
@@ -66,12 +218,17 @@ class DetectorColunas:
         Returns:
             Dicionário com colunas detectadas
         """
-        return {
-            'ativo': DetectorColunas.encontrar_coluna(df, DetectorColunas.PADROES_ATIVO),
-            'valor': DetectorColunas.encontrar_coluna(df, DetectorColunas.PADROES_VALOR),
-            'vencimento': DetectorColunas.encontrar_coluna(df, DetectorColunas.PADROES_VENCIMENTO),
-            'classe': DetectorColunas.encontrar_coluna(df, DetectorColunas.PADROES_CLASSE)
-        }
+        encontradas: Dict[str, Optional[str]] = dict.fromkeys(DetectorColunas._RX_POR_TIPO)
+        
+        # Uma única passada pelas colunas, parando quando todos os tipos forem encontrados
+        for coluna in df.columns:
+            for tipo, padrao in DetectorColunas._RX_POR_TIPO.items():
+                if encontradas[tipo] is None and padrao.match(coluna):
+                    encontradas[tipo] = coluna
+            if all(encontradas.values()):
+                break
+        
+        return encontradas
 
 
 class LimpadorDados:
@@ -100,9 +257,109 @@ class LimpadorDados:
     def remover_linhas_duplicadas(df: pd.DataFrame, coluna_chave: str = 'Ativo') -> pd.DataFrame:
         """Remove linhas duplicadas baseado em coluna chave."""
         if coluna_chave in df.columns:
+            # Chave sem repetições (o caso comum): nada a remover
+            if df[coluna_chave].is_unique:
+                return df
             return df.drop_duplicates(subset=[coluna_chave], keep='first')
         return df
     
+    @staticmethod
+    def converter_serie_numerica(serie: pd.Series) -> pd.Series:
+        """
+        Converte uma série para numérico, tratando diferentes formatos.
+        
+        Args:
+            serie: Série a converter
+            
+        Returns:
+            Nova série numérica (valores inválidos viram NaN)
+        """
+        # Colunas já numéricas (o caso comum em planilhas Excel) não precisam de limpeza
+        if pd.api.types.is_numeric_dtype(serie):
+            return LimpadorDados._tipos_numpy(serie)
+        
+        # Colunas de texto muito grandes: conversão compilada em uma única passada
+        if (_converter_brl is not None and len(serie) > LIMIAR_NUMBA
+                and pd.api.types.is_string_dtype(serie.dtype)
+                and (serie.dtype != 'object' or pd.api.types.infer_dtype(serie, skipna=True) == 'string')):
+            return LimpadorDados._converter_serie_numba(serie)
+        
+        # Remover símbolos de moeda e separadores em uma única passada
+        if serie.dtype.kind in 'OU':
+            # Colunas de texto (object, string ou string do Arrow) já estão prontas;
+            # só colunas object com valores de outros tipos precisam virar texto
+            if serie.dtype == 'object' and pd.api.types.infer_dtype(serie, skipna=True) != 'string':
+                serie = serie.astype(str)
+            # Strings do Arrow só aceitam o padrão como texto (usam o kernel do pyarrow)
+            padrao = _RX_MOEDA if serie.dtype == 'object' else _RX_MOEDA.pattern
+            serie = (
+                serie.str.replace(padrao, '', regex=True)
+                .str.replace(',', '.', regex=False)
+            )
+        
+        return LimpadorDados._tipos_numpy(pd.to_numeric(serie, errors='coerce'))
+    
+    @staticmethod
+    def _tipos_numpy(serie: pd.Series) -> pd.Series:
+        """
+        Converte séries numéricas do Arrow/nullable para float64 do numpy.
+        
+        Nesses tipos o NaN de um texto inválido não é nulo (isna() e sum() o
+        ignorariam); em float64 tanto NaN quanto nulo viram NaN. Séries numpy
+        são devolvidas sem alteração.
+        """
+        if not pd.api.types.is_extension_array_dtype(serie.dtype):
+            return serie
+        return pd.Series(
+            serie.to_numpy(dtype='float64', na_value=np.nan),
+            index=serie.index, name=serie.name
+        )
+    
+    @staticmethod
+    def _converter_serie_numba(serie: pd.Series) -> pd.Series:
+        """
+        Converte uma série de textos com o kernel numba _converter_brl.
+        
+        Os textos que o kernel não reconhece são convertidos pelo caminho
+        padrão, então o resultado é o mesmo, sempre em float64.
+        """
+        textos = serie.to_numpy(dtype=str, na_value='')
+        codigos = textos.view(np.uint32).reshape(len(textos), -1)
+        valores = np.empty(len(textos), dtype=np.float64)
+        invalidos = np.zeros(len(textos), dtype=np.bool_)
+        _converter_brl(codigos, valores, invalidos)
+        
+        if invalidos.any():
+            restantes = LimpadorDados.converter_serie_numerica(serie[invalidos])
+            valores[invalidos] = restantes.to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        return pd.Series(valores, index=serie.index, name=serie.name)
+    
+    @staticmethod
+    def converter_serie_datas(serie: pd.Series) -> pd.Series:
+        """
+        Converte uma série para datetime, tentando diferentes formatos.
+        
+        Args:
+            serie: Série a converter
+            
+        Returns:
+            Nova série de datas (valores inválidos viram NaT)
+        """
+        # Escolher o formato a partir do primeiro valor preenchido
+        preenchidos = serie.dropna()
+        formato = _adivinhar_formato_data(preenchidos.iloc[0]) if len(preenchidos) else None
+        
+        if formato is not None and formato.startswith('%Y-%m-%d'):
+            # Datas ISO 8601 (com ou sem horário) usam o parser ISO nativo do pandas
+            return pd.to_datetime(serie, format='ISO8601', cache=True, errors='coerce')
+        
+        if formato is not None:
+            return pd.to_datetime(serie, format=formato, errors='coerce')
+        
+        # Se nenhum formato foi reconhecido, tentar inferência automática
+        return pd.to_datetime(serie, errors='coerce')
+    
     @staticmethod
     def converter_valores_numericos(df: pd.DataFrame, coluna: str) -> pd.DataFrame:
         """
@@ -118,19 +375,7 @@ class LimpadorDados:
         if coluna not in df.columns:
             return df
         
-        df = df.copy()
-        
-        # Remover símbolos de moeda e separadores
-        if df[coluna].dtype == 'object':
-            df[coluna] = df[coluna].astype(str)
-            df[coluna] = df[coluna].str.replace('R$', '', regex=False)
-            df[coluna] = df[coluna].str.replace('$', '', regex=False)
-            df[coluna] = df[coluna].str.replace('.', '', regex=False)
-            df[coluna] = df[coluna].str.replace(',', '.', regex=False)
-        
-        df[coluna] = pd.to_numeric(df[coluna], errors='coerce')
-        
-        return df
+        return df.assign(**{coluna: LimpadorDados.converter_serie_numerica(df[coluna])})
     
     @staticmethod
     def converter_datas(df: pd.DataFrame, coluna: str) -> pd.DataFrame:
@@ -147,33 +392,13 @@ class LimpadorDados:
         if coluna not in df.columns:
             return df
         
-        df = df.copy()
-        
-        # Tentar diferentes formatos
-        formatos = [
-            '%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d',
-            '%d/%m/%Y %H:%M:%S', '%d-%m-%Y %H:%M:%S'
-        ]
-        
-        for formato in formatos:
-            try:
-                df[coluna] = pd.to_datetime(df[coluna], format=formato, errors='coerce')
-                if df[coluna].notna().sum() > 0:
-                    return df
-            except:
-                continue
-        
-        # Se nenhum formato funcionou, tentar inferência automática
-        df[coluna] = pd.to_datetime(df[coluna], errors='coerce')
-        
-        return df
+        return df.assign(**{coluna: LimpadorDados.converter_serie_datas(df[coluna])})
     
     @staticmethod
     def preencher_valores_ausentes(df: pd.DataFrame, coluna: str, valor_padrao: str = 'N/A') -> pd.DataFrame:
         """Preenche valores ausentes em uma coluna."""
-        df = df.copy()
         if coluna in df.columns:
-            df[coluna] = df[coluna].fillna(valor_padrao)
+            return df.assign(**{coluna: df[coluna].fillna(valor_padrao)})
         return df
 
 
@@ -186,12 +411,14 @@ class ProcessadorPlanilhas:
         self.limpador = LimpadorDados()
         self.colunas_detectadas: Dict[str, Optional[str]] = {}
     
-    def carregar_planilha(self, caminho_arquivo: str, nome_aba: Optional[str] = None) -> Tuple[bool, pd.DataFrame, str]:
+    def carregar_planilha(self, caminho_arquivo: Union[str, pd.ExcelFile],
+                          nome_aba: Optional[str] = None) -> Tuple[bool, pd.DataFrame, str]:
         """
         Carrega uma planilha com tratamento de erros.
         
         Args:
-            caminho_arquivo: Caminho do arquivo
+            caminho_arquivo: Caminho do arquivo ou pd.ExcelFile já aberto
+                (evita reabrir o arquivo a cada aba)
             nome_aba: Nome da aba (se None, carrega primeira aba)
             
         Returns:
@@ -199,20 +426,24 @@ class ProcessadorPlanilhas:
         """
         try:
             # Verificar se arquivo existe
-            if not Path(caminho_arquivo).exists():
+            if not isinstance(caminho_arquivo, pd.ExcelFile) and not Path(caminho_arquivo).exists():
                 return False, None, f"Arquivo não encontrado: {caminho_arquivo}"
             
             # Tentar carregar
-            if nome_aba:
-                df = pd.read_excel(caminho_arquivo, sheet_name=nome_aba)
+            aba = nome_aba if nome_aba else 0
+            if isinstance(caminho_arquivo, pd.ExcelFile):
+                df = pd.read_excel(caminho_arquivo, sheet_name=aba)
             else:
-                df = pd.read_excel(caminho_arquivo)
+                df = ler_excel(caminho_arquivo, 'calamine', sheet_name=aba)
+            
+            # Operações .str da limpeza passam a usar os kernels do Arrow
+            df = _tipos_arrow(df)
             
-            logger.info(f"Planilha carregada: {caminho_arquivo}")
+            logger.info("Planilha carregada: %s", getattr(caminho_arquivo, 'io', caminho_arquivo))
             return True, df, "Planilha carregada com sucesso"
         
         except Exception as e:
-            logger.error(f"Erro ao carregar planilha: {str(e)}")
+            logger.error("Erro ao carregar planilha: %s", e)
             return False, None, f"Erro ao carregar: {str(e)}"
     
     def processar_planilha(self, df: pd.DataFrame, detectar_automaticamente: bool = True) -> Tuple[bool, pd.DataFrame, str]:
@@ -226,9 +457,25 @@ class ProcessadorPlanilhas:
         Returns:
             Tupla (sucesso, DataFrame processado, mensagem)
         """
+        resultado, colunas = self._processar_planilha(df, detectar_automaticamente)
+        self.colunas_detectadas = colunas
+        return resultado
+    
+    def _processar_planilha(self, df: pd.DataFrame, detectar_automaticamente: bool = True
+                            ) -> Tuple[Tuple[bool, pd.DataFrame, str], Dict[str, Optional[str]]]:
+        """
+        Processa uma planilha sem alterar o estado do processador.
+        
+        Seguro para abas processadas em paralelo: as colunas detectadas são
+        devolvidas junto com o resultado em vez de gravadas na instância.
+        
+        Returns:
+            Tupla (resultado de processar_planilha, colunas detectadas)
+        """
+        colunas = self.colunas_detectadas
         try:
             if df is None or df.empty:
-                return False, None, "DataFrame vazio"
+                return (False, None, "DataFrame vazio"), colunas
             
             # Limpeza básica
             df = self.limpador.remover_linhas_vazias(df)
@@ -236,26 +483,31 @@ class ProcessadorPlanilhas:
             
             # Detectar colunas se solicitado
             if detectar_automaticamente:
-                self.colunas_detectadas = self.detector.detectar_colunas(df)
-                logger.info(f"Colunas detectadas: {self.colunas_detectadas}")
+                colunas = self.detector.detectar_colunas(df)
+                logger.info("Colunas detectadas: %s", colunas)
+            
+            # Uma única cópia rasa; as colunas convertidas substituem as originais
+            df = df.copy(deep=False)
             
             # Processar colunas detectadas
-            if self.colunas_detectadas.get('valor'):
-                df = self.limpador.converter_valores_numericos(df, self.colunas_detectadas['valor'])
+            coluna_valor = colunas.get('valor')
+            if coluna_valor and coluna_valor in df.columns:
+                df[coluna_valor] = self.limpador.converter_serie_numerica(df[coluna_valor])
             
-            if self.colunas_detectadas.get('vencimento'):
-                df = self.limpador.converter_datas(df, self.colunas_detectadas['vencimento'])
+            coluna_vencimento = colunas.get('vencimento')
+            if coluna_vencimento and coluna_vencimento in df.columns:
+                df[coluna_vencimento] = self.limpador.converter_serie_datas(df[coluna_vencimento])
             
             # Remover duplicatas
-            if self.colunas_detectadas.get('ativo'):
-                df = self.limpador.remover_linhas_duplicadas(df, self.colunas_detectadas['ativo'])
+            if colunas.get('ativo'):
+                df = self.limpador.remover_linhas_duplicadas(df, colunas['ativo'])
             
-            logger.info(f"Planilha processada: {len(df)} linhas")
-            return True, df, f"Planilha processada com sucesso ({len(df)} registros)"
+            logger.info("Planilha processada: %s linhas", len(df))
+            return (True, df, f"Planilha processada com sucesso ({len(df)} registros)"), colunas
         
         except Exception as e:
-            logger.error(f"Erro ao processar planilha: {str(e)}")
-            return False, None, f"Erro ao processar: {str(e)}"
+            logger.error("Erro ao processar planilha: %s", e)
+            return (False, None, f"Erro ao processar: {str(e)}"), colunas
     
     def mapear_colunas_customizadas(self, df: pd.DataFrame, mapeamento: Dict[str, str]) -> pd.DataFrame:
         """
@@ -274,7 +526,7 @@ class ProcessadorPlanilhas:
         mapeamento_valido = {k: v for k, v in mapeamento.items() if k in df.columns}
         
         df = df.rename(columns=mapeamento_valido)
-        logger.info(f"Colunas mapeadas: {mapeamento_valido}")
+        logger.info("Colunas mapeadas: %s", mapeamento_valido)
         
         return df
     
@@ -293,21 +545,23 @@ class ProcessadorPlanilhas:
         if df is None or df.empty:
             return False, ["DataFrame vazio"]
         
+        colunas = set(df.columns)
+        
         # Verificar colunas essenciais
         colunas_essenciais = ['Ativo', 'Valor', 'Categoria']
-        colunas_faltantes = [col for col in colunas_essenciais if col not in df.columns]
+        colunas_faltantes = [col for col in colunas_essenciais if col not in colunas]
         
         if colunas_faltantes:
             avisos.append(f"Colunas faltantes: {', '.join(colunas_faltantes)}")
         
         # Verificar valores numéricos
-        if 'Valor' in df.columns:
+        if 'Valor' in colunas:
             valores_invalidos = df['Valor'].isna().sum()
             if valores_invalidos > 0:
                 avisos.append(f"{valores_invalidos} valores inválidos na coluna Valor")
         
         # Verificar datas
-        if 'Data Vencimento' in df.columns:
+        if 'Data Vencimento' in colunas:
             datas_invalidas = df['Data Vencimento'].isna().sum()
             if datas_invalidas > len(df) * 0.5:
                 avisos.append(f"Mais de 50% das datas são inválidas")
@@ -323,7 +577,7 @@ class ProcessadorPlanilhas:
         """
         return {
             'colunas_detectadas': self.colunas_detectadas,
-            'timestamp': pd.Timestamp.now().isoformat()
+            'timestamp': datetime.now().isoformat(timespec='seconds')
         }
 
 
@@ -334,6 +588,7 @@ class ProcessadorMultiplasAbas:
         """Inicializa o processador."""
         self.processador = ProcessadorPlanilhas()
         self.abas_processadas: Dict[str, pd.DataFrame] = {}
+        self.colunas_por_aba: Dict[str, Dict[str, Optional[str]]] = {}
     
     def listar_abas(self, caminho_arquivo: str) -> Tuple[bool, List[str], str]:
         """
@@ -349,7 +604,7 @@ class ProcessadorMultiplasAbas:
             abas = pd.ExcelFile(caminho_arquivo).sheet_names
             return True, abas, f"Encontradas {len(abas)} abas"
         except Exception as e:
-            logger.error(f"Erro ao listar abas: {str(e)}")
+            logger.error("Erro ao listar abas: %s", e)
             return False, [], f"Erro: {str(e)}"
     
     def processar_todas_abas(self, caminho_arquivo: str) -> Tuple[bool, Dict[str, pd.DataFrame], str]:
@@ -363,22 +618,23 @@ class ProcessadorMultiplasAbas:
             Tupla (sucesso, dicionário de abas processadas, mensagem)
         """
         try:
-            # Listar abas
-            sucesso, abas, msg = self.listar_abas(caminho_arquivo)
-            if not sucesso:
-                return False, {}, msg
+            # Ler todas as abas em uma única passada pelo arquivo (um CSV é uma aba só)
+            abas = ler_excel(caminho_arquivo, 'calamine', sheet_name=None)
+            abas = {aba: _tipos_arrow(df) for aba, df in abas.items()}
             
-            # Processar cada aba
-            for aba in abas:
-                sucesso, df, msg = self.processador.carregar_planilha(caminho_arquivo, aba)
-                if sucesso:
-                    sucesso, df_proc, msg = self.processador.processar_planilha(df)
+            # Processar as abas em paralelo; o map devolve os resultados na ordem das abas
+            # e cada aba traz as próprias colunas detectadas
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(abas)))) as executor:
+                resultados = executor.map(self.processador._processar_planilha, abas.values())
+                for aba, ((sucesso, df_proc, msg), colunas) in zip(abas.keys(), resultados):
+                    self.colunas_por_aba[aba] = colunas
+                    self.processador.colunas_detectadas = colunas
                     if sucesso:
                         self.abas_processadas[aba] = df_proc
-                        logger.info(f"Aba '{aba}' processada com sucesso")
+                        logger.info("Aba '%s' processada com sucesso", aba)
             
             return True, self.abas_processadas, f"Processadas {len(self.abas_processadas)} abas"
         
         except Exception as e:
-            logger.error(f"Erro ao processar abas: {str(e)}")
+            logger.error("Erro ao processar abas: %s", e)
             return False, {}, f"Erro: {str(e)}"
@@ -3,17 +3,28 @@ Módulo de utilitários e funções auxiliares.
 """
 
 import os
+import re
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
 import logging
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Caracteres removidos do nome do cliente (mantém letras, números, espaço, '_' e '-')
+_RX_NOME_INVALIDO = re.compile(r'[^\w \-]+')
+
+# Troca os separadores do formato americano (1,234.56) pelos brasileiros (1.234,56)
+_TRADUCAO_BR = str.maketrans(',.', '.,')
+
 
 class GerenciadorArquivos:
     """Gerenciador de arquivos para upload e processamento."""
     
-    EXTENSOES_PERMITIDAS = {'.xlsx', '.xls', '.csv'}
+    EXTENSOES_PERMITIDAS = {'.xlsx', '.xls', '.csv', '.parquet'}
     TAMANHO_MAXIMO_MB = 50
     
     @staticmethod
@@ -27,16 +38,20 @@ class GerenciadorArquivos:
         Returns:
             Tupla (válido, mensagem)
         """
-        if not os.path.exists(caminho_arquivo):
+        # Uma única chamada ao sistema para existência e tamanho; como em
+        # os.path.exists, qualquer falha (permissão, nome longo demais,
+        # caractere nulo) conta como arquivo inexistente
+        try:
+            info = os.stat(caminho_arquivo)
+        except (OSError, ValueError):
             return False, "Arquivo não encontrado"
         
         # Verificar extensão
-        _, ext = os.path.splitext(caminho_arquivo)
-        if ext.lower() not in GerenciadorArquivos.EXTENSOES_PERMITIDAS:
+        if Path(caminho_arquivo).suffix.lower() not in GerenciadorArquivos.EXTENSOES_PERMITIDAS:
             return False, f"Extensão não permitida. Use: {', '.join(GerenciadorArquivos.EXTENSOES_PERMITIDAS)}"
         
         # Verificar tamanho
-        tamanho_mb = os.path.getsize(caminho_arquivo) / (1024 * 1024)
+        tamanho_mb = info.st_size / (1024 * 1024)
         if tamanho_mb > GerenciadorArquivos.TAMANHO_MAXIMO_MB:
             return False, f"Arquivo muito grande. Máximo: {GerenciadorArquivos.TAMANHO_MAXIMO_MB}MB"
         
@@ -55,18 +70,18 @@ class GerenciadorArquivos:
         """
         try:
             # Sanitizar nome do cliente
-            nome_sanitizado = "".join(c for c in nome_cliente if c.isalnum() or c in (' ', '_', '-')).rstrip()
+            nome_sanitizado = _RX_NOME_INVALIDO.sub('', nome_cliente).rstrip()
             
             # Criar diretório
             data_str = datetime.now().strftime("%Y%m%d_%H%M%S")
             diretorio = f"./relatorios/{nome_sanitizado}_{data_str}"
             
             os.makedirs(diretorio, exist_ok=True)
-            logger.info(f"Diretório criado: {diretorio}")
+            logger.info("Diretório criado: %s", diretorio)
             
             return diretorio
         except Exception as e:
-            logger.error(f"Erro ao criar diretório: {str(e)}")
+            logger.error("Erro ao criar diretório: %s", e)
             return None
 
 
@@ -85,7 +100,7 @@ class FormatadorDados:
         Returns:
             Valor formatado
         """
-        return f"{simbolo} {valor:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
+        return f"{simbolo} {valor:,.2f}".translate(_TRADUCAO_BR)
     
     @staticmethod
     def formatar_percentual(valor: float, casas_decimais: int = 2) -> str:
@@ -113,9 +128,13 @@ class FormatadorDados:
         Returns:
             Data formatada
         """
-        if data is None or pd.isna(data):
+        if data is None:
+            return "N/A"
+        try:
+            return data.strftime(formato)
+        except (AttributeError, ValueError):
+            # NaN não tem strftime e NaT não permite formatação
             return "N/A"
-        return data.strftime(formato)
     
     @staticmethod
     def formatar_numero(valor: float, casas_decimais: int = 2) -> str:
@@ -129,7 +148,51 @@ class FormatadorDados:
         Returns:
             Número formatado
         """
-        return f"{valor:,.{casas_decimais}f}".replace(',', 'X').replace('.', ',').replace('X', '.')
+        return f"{valor:,.{casas_decimais}f}".translate(_TRADUCAO_BR)
+    
+    @staticmethod
+    def formatar_moeda_series(serie: "pd.Series", simbolo: str = "R$") -> "pd.Series":
+        """
+        Formata uma série de valores como moeda, sem percorrer linha a linha.
+        
+        Args:
+            serie: Valores a formatar
+            simbolo: Símbolo de moeda
+            
+        Returns:
+            Série de textos formatados
+        """
+        return (simbolo + " " + serie.map("{:,.2f}".format)).str.translate(_TRADUCAO_BR)
+    
+    @staticmethod
+    def formatar_percentual_series(serie: "pd.Series", casas_decimais: int = 2) -> "pd.Series":
+        """
+        Formata uma série de valores como percentual.
+        
+        Args:
+            serie: Valores a formatar (0-100)
+            casas_decimais: Número de casas decimais
+            
+        Returns:
+            Série de textos formatados
+        """
+        return serie.map(f"{{:.{casas_decimais}f}}%".format)
+    
+    @staticmethod
+    def formatar_data_series(serie: "pd.Series", formato: str = "%d/%m/%Y") -> "pd.Series":
+        """
+        Formata uma série de datas.
+        
+        Args:
+            serie: Datas a formatar
+            formato: Formato desejado
+            
+        Returns:
+            Série de textos formatados ("N/A" para datas ausentes)
+        """
+        import pandas as pd
+        
+        return pd.to_datetime(serie).dt.strftime(formato).fillna("N/A")
 
 
 class GeradorRelatorios:
@@ -146,46 +209,54 @@ class GeradorRelatorios:
         Returns:
             Texto formatado
         """
-        texto = "=" * 80 + "\n"
-        texto += "RELATÓRIO DE ANÁLISE DE CARTEIRA\n"
-        texto += "=" * 80 + "\n\n"
+        linhas = [
+            "=" * 80,
+            "RELATÓRIO DE ANÁLISE DE CARTEIRA",
+            "=" * 80,
+            ""
+        ]
         
         if 'data_processamento' in dados:
-            texto += f"Data de Processamento: {dados['data_processamento']}\n\n"
+            linhas += [f"Data de Processamento: {dados['data_processamento']}", ""]
         
-        texto += "RESUMO EXECUTIVO\n"
-        texto += "-" * 80 + "\n"
+        linhas += ["RESUMO EXECUTIVO", "-" * 80]
         
         if 'estatisticas' in dados:
             stats = dados['estatisticas']
-            texto += f"Total de Ativos: {stats.get('total_ativos', 0)}\n"
-            texto += f"Valor Total: {FormatadorDados.formatar_moeda(stats.get('valor_total', 0))}\n"
-            texto += f"Valor Médio: {FormatadorDados.formatar_moeda(stats.get('valor_medio', 0))}\n"
-            texto += f"Categorias: {stats.get('categorias', 0)}\n\n"
+            linhas += [
+                f"Total de Ativos: {stats.get('total_ativos', 0)}",
+                f"Valor Total: {FormatadorDados.formatar_moeda(stats.get('valor_total', 0))}",
+                f"Valor Médio: {FormatadorDados.formatar_moeda(stats.get('valor_medio', 0))}",
+                f"Categorias: {stats.get('categorias', 0)}",
+                ""
+            ]
         
         if 'diversificacao' in dados:
             div = dados['diversificacao']
-            texto += "DIVERSIFICAÇÃO\n"
-            texto += "-" * 80 + "\n"
-            texto += f"Score de Diversificação: {div.get('diversificacao_score', 0)}/100\n"
-            texto += f"Classificação: {div.get('classificacao_concentracao', 'N/A')}\n"
-            texto += f"Número de Ativos: {div.get('numero_ativos', 0)}\n"
-            texto += f"Maior Posição: {FormatadorDados.formatar_percentual(div.get('maior_posicao_percentual', 0))}\n"
-            texto += f"Top 5: {FormatadorDados.formatar_percentual(div.get('top_5_percentual', 0))}\n\n"
+            linhas += [
+                "DIVERSIFICAÇÃO",
+                "-" * 80,
+                f"Score de Diversificação: {div.get('diversificacao_score', 0)}/100",
+                f"Classificação: {div.get('classificacao_concentracao', 'N/A')}",
+                f"Número de Ativos: {div.get('numero_ativos', 0)}",
+                f"Maior Posição: {FormatadorDados.formatar_percentual(div.get('maior_posicao_percentual', 0))}",
+                f"Top 5: {FormatadorDados.formatar_percentual(div.get('top_5_percentual', 0))}",
+                ""
+            ]
         
         if 'risco' in dados:
             risco = dados['risco']
-            texto += "ANÁLISE DE RISCO\n"
-            texto += "-" * 80 + "\n"
-            texto += f"Nível de Risco Geral: {risco.get('nivel_risco_geral', 'N/A')}\n"
-            texto += f"Risco Crítico: {FormatadorDados.formatar_percentual(risco.get('risco_critico_percentual', 0))}\n"
-            texto += f"Risco Moderado: {FormatadorDados.formatar_percentual(risco.get('risco_moderado_percentual', 0))}\n"
-            texto += f"Risco Baixo: {FormatadorDados.formatar_percentual(risco.get('risco_baixo_percentual', 0))}\n\n"
+            linhas += [
+                "ANÁLISE DE RISCO",
+                "-" * 80,
+                f"Nível de Risco Geral: {risco.get('nivel_risco_geral', 'N/A')}",
+                f"Risco Crítico: {FormatadorDados.formatar_percentual(risco.get('risco_critico_percentual', 0))}",
+                f"Risco Moderado: {FormatadorDados.formatar_percentual(risco.get('risco_moderado_percentual', 0))}",
+                f"Risco Baixo: {FormatadorDados.formatar_percentual(risco.get('risco_baixo_percentual', 0))}",
+                ""
+            ]
         
-        texto += "=" * 80 + "\n"
+        # Linha final vazia para manter a quebra de linha no fim do texto
+        linhas += ["=" * 80, ""]
         
-        return texto
-
-
-# Importar pandas para uso em FormatadorDados
-import pandas as pd
+        return "\n".join(linhas)
@@ -4,92 +4,141 @@ Exemplo de uso do Carteira Analyzer com dados fictícios.
 Demonstra como usar a biblioteca programaticamente.
 """
 
+import hashlib
+import os
 import sys
 from pathlib import Path
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 # Adicionar diretório ao path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from core import ProcessadorCarteira, AnalisadorAvancado, GerenciadorArquivos
-from core.gerador_relatorios import GeradorGraficos, GeradorRelatorioHTML
 
 
-def criar_dados_exemplo():
-    """Cria dados de exemplo para demonstração."""
+def _escrever_linhas(linhas):
+    """Escreve as linhas no console com uma única chamada."""
+    sys.stdout.write("\n".join(linhas) + "\n")
+
+
+def criar_dados_exemplo(formato='parquet'):
+    """
+    Cria dados de exemplo para demonstração.
+    
+    Args:
+        formato: 'parquet' ou 'csv' (um arquivo por categoria) ou 'xlsx'
+            (um único workbook com uma aba por categoria)
+    
+    Returns:
+        Pares (arquivo, aba) de renda fixa, COE, renda variável e derivativos
+    """
     
     print("📊 Criando dados de exemplo...")
     
+    # Data base única; os vencimentos são somados a ela em uma operação vetorizada
+    hoje = np.datetime64('today', 'D')
+    
+    # Arquivos temporários
+    temp_dir = Path('/tmp/carteira_exemplo')
+    temp_dir.mkdir(exist_ok=True)
+    
+    nomes = ('renda_fixa', 'coe', 'renda_variavel', 'derivativos')
+    if formato == 'xlsx':
+        arquivo = str(temp_dir / 'carteira.xlsx')
+        fontes = tuple((arquivo, nome) for nome in nomes)
+    else:
+        fontes = tuple((str(temp_dir / f'{nome}.{formato}'), 0) for nome in nomes)
+    
+    # Os dados só dependem do formato e da data base: reaproveitar os arquivos
+    # do mesmo dia (incrementar a versão ao mudar o esquema)
+    chave = hashlib.blake2b(
+        f'carteira-fixtures-v1|{formato}|{hoje}'.encode(), digest_size=8
+    ).hexdigest()
+    arquivo_chave = temp_dir / '.cache_key'
+    if (all(Path(arquivo).exists() for arquivo, _ in fontes)
+            and arquivo_chave.exists() and arquivo_chave.read_text(errors='ignore') == chave):
+        print(f"✅ Dados reaproveitados de {temp_dir}")
+        return fontes
+    
+    def vencimentos(dias):
+        return pd.DatetimeIndex(hoje + np.array(dias, dtype='timedelta64[D]'))
+    
     # Dados de Renda Fixa
     rf_data = {
         'Ativo': ['LTN 01/01/2024', 'LTN 01/04/2024', 'NTN-B 15/08/2024', 'CDB Banco X', 'Debênture Y'],
-        'Valor Bruto - Opção Cliente': [10000, 15000, 20000, 8000, 12000],
-        'Data Vencimento': [
-            datetime.now() + timedelta(days=30),
-            datetime.now() + timedelta(days=90),
-            datetime.now() + timedelta(days=180),
-            datetime.now() + timedelta(days=365),
-            datetime.now() + timedelta(days=730)
-        ],
-        'Sub Mercado': ['Tesouro Direto', 'Tesouro Direto', 'Tesouro Direto', 'Renda Fixa', 'Renda Fixa']
+        'Valor Bruto - Opção Cliente': np.array([10000, 15000, 20000, 8000, 12000], dtype='float64'),
+        'Data Vencimento': vencimentos([30, 90, 180, 365, 730]),
+        'Sub Mercado': pd.Categorical(['Tesouro Direto', 'Tesouro Direto', 'Tesouro Direto', 'Renda Fixa', 'Renda Fixa'])
     }
     
     # Dados de COE
     coe_data = {
         'Ativo': ['COE Ação PETR4', 'COE Índice IBOV', 'COE Moeda USD'],
-        'Valor Bruto - Opção Cliente': [5000, 7000, 3000],
-        'Data Vencimento': [
-            datetime.now() + timedelta(days=180),
-            datetime.now() + timedelta(days=365),
-            datetime.now() + timedelta(days=90)
-        ],
-        'Tipo': ['Ação', 'Índice', 'Moeda']
+        'Valor Bruto - Opção Cliente': np.array([5000, 7000, 3000], dtype='float64'),
+        'Data Vencimento': vencimentos([180, 365, 90]),
+        'Tipo': pd.Categorical(['Ação', 'Índice', 'Moeda'])
     }
     
     # Dados de Renda Variável
     rv_data = {
         'Ativo': ['PETR4', 'VALE3', 'ITUB4', 'BBDC4', 'Fundo Imobiliário ABC'],
-        'Valor Atual': [25000, 18000, 12000, 15000, 8000],
-        'Tipo': ['Ação', 'Ação', 'Ação', 'Ação', 'Fundo Imobiliário']
+        'Valor Atual': np.array([25000, 18000, 12000, 15000, 8000], dtype='float64'),
+        'Tipo': pd.Categorical(['Ação', 'Ação', 'Ação', 'Ação', 'Fundo Imobiliário'])
     }
     
     # Dados de Derivativos
     der_data = {
         'Ativo': ['Opção PETR4 Call', 'Futuro IBOV', 'Swap USD/BRL'],
-        'Valor': [2000, 5000, 3000],
-        'Data Vencimento': [
-            datetime.now() + timedelta(days=15),
-            datetime.now() + timedelta(days=30),
-            datetime.now() + timedelta(days=60)
-        ],
-        'Tipo': ['Opção', 'Futuro', 'Swap']
+        'Valor': np.array([2000, 5000, 3000], dtype='float64'),
+        'Data Vencimento': vencimentos([15, 30, 60]),
+        'Tipo': pd.Categorical(['Opção', 'Futuro', 'Swap'])
     }
     
-    # Criar DataFrames
-    df_rf = pd.DataFrame(rf_data)
-    df_coe = pd.DataFrame(coe_data)
-    df_rv = pd.DataFrame(rv_data)
-    df_der = pd.DataFrame(der_data)
-    
-    # Salvar em arquivos temporários
-    temp_dir = Path('/tmp/carteira_exemplo')
-    temp_dir.mkdir(exist_ok=True)
-    
-    rf_file = temp_dir / 'renda_fixa.xlsx'
-    coe_file = temp_dir / 'coe.xlsx'
-    rv_file = temp_dir / 'renda_variavel.xlsx'
-    der_file = temp_dir / 'derivativos.xlsx'
-    
-    df_rf.to_excel(rf_file, index=False)
-    df_coe.to_excel(coe_file, index=False)
-    df_rv.to_excel(rv_file, index=False)
-    df_der.to_excel(der_file, index=False)
+    # Criar DataFrames (colunas já tipadas, sem cópia nem inferência por coluna;
+    # as classes repetidas são categóricas)
+    df_rf = pd.DataFrame(rf_data, copy=False)
+    df_coe = pd.DataFrame(coe_data, copy=False)
+    df_rv = pd.DataFrame(rv_data, copy=False)
+    df_der = pd.DataFrame(der_data, copy=False)
+    
+    # Salvar (a chave só é gravada depois que todos os arquivos estiverem prontos)
+    arquivo_chave.unlink(missing_ok=True)
+    tabelas = (df_rf, df_coe, df_rv, df_der)
+    
+    if formato == 'xlsx':
+        # Um único contêiner zip com uma aba por categoria, gravado só com
+        # valores e linha a linha (xlsxwriter em modo constant_memory)
+        import xlsxwriter
+        
+        workbook = xlsxwriter.Workbook(fontes[0][0], {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd'
+        })
+        try:
+            for (_, aba), df in zip(fontes, tabelas):
+                planilha = workbook.add_worksheet(aba)
+                planilha.write_row(0, 0, list(df.columns))
+                for i, linha in enumerate(df.itertuples(index=False, name=None), start=1):
+                    planilha.write_row(i, 0, linha)
+        finally:
+            workbook.close()
+    elif formato == 'csv':
+        # CSV: os arquivos só são relidos pelo ProcessadorCarteira, sem formatação Excel
+        for (arquivo, _), df in zip(fontes, tabelas):
+            df.to_csv(arquivo, index=False, date_format='%Y-%m-%d')
+    else:
+        # Parquet: binário colunar, sem inferência de tipos na leitura e com
+        # as colunas categóricas preservadas
+        for (arquivo, _), df in zip(fontes, tabelas):
+            df.to_parquet(arquivo, engine='pyarrow', compression='snappy', index=False)
     
+    arquivo_chave.write_text(chave)
     print(f"✅ Dados criados em {temp_dir}")
     
-    return rf_file, coe_file, rv_file, der_file
+    return fontes
 
 
 def exemplo_basico():
@@ -100,170 +149,191 @@ def exemplo_basico():
     print("="*80)
     
     # Criar dados
-    rf_file, coe_file, rv_file, der_file = criar_dados_exemplo()
+    rf, coe, rv, der = criar_dados_exemplo()
     
     # Criar processador
     processador = ProcessadorCarteira()
     
     # Carregar dados
     print("\n📂 Carregando dados...")
-    processador.carregar_renda_fixa(str(rf_file))
-    processador.carregar_coe(str(coe_file))
-    processador.carregar_renda_variavel(str(rv_file))
-    processador.carregar_derivativos(str(der_file))
+    processador.carregar_renda_fixa(*rf)
+    processador.carregar_coe(*coe)
+    processador.carregar_renda_variavel(*rv)
+    processador.carregar_derivativos(*der)
     
     # Consolidar
     print("\n🔄 Consolidando carteira...")
     carteira = processador.consolidar_carteira()
     print(f"✅ Carteira consolidada com {len(carteira)} ativos")
     
-    # Obter resumo
-    print("\n📊 RESUMO DA CARTEIRA")
-    print("-" * 80)
-    
+    # Relatório no console: as linhas de cada exemplo são acumuladas e
+    # escritas de uma vez
     stats = processador.obter_estatisticas()
-    print(f"Total de Ativos: {stats['total_ativos']}")
-    print(f"Valor Total: R$ {stats['valor_total']:,.2f}")
-    print(f"Valor Médio: R$ {stats['valor_medio']:,.2f}")
-    print(f"Categorias: {stats['categorias']}")
+    alocacao, total = processador.obter_resumo_alocacao()
+    alertas = processador.obter_alertas_vencimento()
     
-    # Alocação
-    print("\n💼 ALOCAÇÃO POR CATEGORIA")
-    print("-" * 80)
+    # Resumo
+    linhas = [
+        "\n📊 RESUMO DA CARTEIRA",
+        "-" * 80,
+        f"Total de Ativos: {stats['total_ativos']}",
+        f"Valor Total: R$ {stats['valor_total']:,.2f}",
+        f"Valor Médio: R$ {stats['valor_medio']:,.2f}",
+        f"Categorias: {stats['categorias']}"
+    ]
     
-    alocacao, total = processador.obter_resumo_alocacao()
-    for _, row in alocacao.iterrows():
-        print(f"{row['Categoria']:20} | R$ {row['Valor Total']:12,.2f} | {row['Percentual']:6.2f}%")
+    # Alocação
+    linhas += ["\n💼 ALOCAÇÃO POR CATEGORIA", "-" * 80]
+    linhas += [
+        f"{categoria:20} | R$ {valor_total:12,.2f} | {percentual:6.2f}%"
+        for categoria, valor_total, percentual
+        in alocacao[['Categoria', 'Valor Total', 'Percentual']].itertuples(index=False, name=None)
+    ]
     
     # Alertas
-    print("\n⚠️  ALERTAS DE VENCIMENTO")
-    print("-" * 80)
-    
-    alertas = processador.obter_alertas_vencimento()
+    linhas += ["\n⚠️  ALERTAS DE VENCIMENTO", "-" * 80]
     if alertas is not None and not alertas.empty:
-        for _, row in alertas.iterrows():
-            dias = int(row['Dias para Vencer']) if pd.notna(row['Dias para Vencer']) else 0
-            print(f"{row['Ativo']:30} | {dias:3} dias | {row['Status Vencimento']}")
+        # 'Dias para Vencer' já é Int32 anulável: vazios viram 0 na própria conversão
+        dias_vec = alertas['Dias para Vencer'].to_numpy(dtype='int32', na_value=0)
+        linhas += [
+            f"{ativo:30} | {dias:3} dias | {status}"
+            for ativo, dias, status
+            in zip(alertas['Ativo'].to_numpy(), dias_vec, alertas['Status Vencimento'].to_numpy())
+        ]
     else:
-        print("Nenhum alerta de vencimento")
+        linhas.append("Nenhum alerta de vencimento")
+    
+    _escrever_linhas(linhas)
     
-    return processador, carteira
+    return processador, carteira, alocacao, total, stats
 
 
 def exemplo_analises_avancadas(processador, carteira):
     """Exemplo de análises avançadas."""
     
-    print("\n" + "="*80)
-    print("EXEMPLO 2: ANÁLISES AVANÇADAS".center(80))
-    print("="*80)
-    
-    # Criar analisador
     analisador = AnalisadorAvancado(carteira)
+    diversificacao = analisador.analisar_diversificacao()
+    vencimentos = analisador.analisar_vencimentos()
+    risco = analisador.analisar_risco_vencimento()
+    top_ativos = analisador.obter_top_ativos(10)
     
-    # Diversificação
-    print("\n🎯 ANÁLISE DE DIVERSIFICAÇÃO")
-    print("-" * 80)
+    linhas = [
+        "\n" + "="*80,
+        "EXEMPLO 2: ANÁLISES AVANÇADAS".center(80),
+        "="*80
+    ]
     
-    diversificacao = analisador.analisar_diversificacao()
-    print(f"Score de Diversificação: {diversificacao['diversificacao_score']}/100")
-    print(f"Classificação: {diversificacao['classificacao_concentracao']}")
-    print(f"Número de Ativos: {diversificacao['numero_ativos']}")
-    print(f"Número de Classes: {diversificacao['numero_classes']}")
-    print(f"Maior Posição: {diversificacao['maior_posicao_percentual']:.2f}%")
-    print(f"Top 5: {diversificacao['top_5_percentual']:.2f}%")
-    print(f"HHI: {diversificacao['hhi']:.2f}")
+    # Diversificação
+    linhas += [
+        "\n🎯 ANÁLISE DE DIVERSIFICAÇÃO",
+        "-" * 80,
+        f"Score de Diversificação: {diversificacao['diversificacao_score']}/100",
+        f"Classificação: {diversificacao['classificacao_concentracao']}",
+        f"Número de Ativos: {diversificacao['numero_ativos']}",
+        f"Número de Classes: {diversificacao['numero_classes']}",
+        f"Maior Posição: {diversificacao['maior_posicao_percentual']:.2f}%",
+        f"Top 5: {diversificacao['top_5_percentual']:.2f}%",
+        f"HHI: {diversificacao['hhi']:.2f}"
+    ]
     
     # Vencimentos
-    print("\n📅 ANÁLISE DE VENCIMENTOS")
-    print("-" * 80)
-    
-    vencimentos = analisador.analisar_vencimentos()
-    print(f"Próximos 30 dias: R$ {vencimentos['valor_proximo_30_dias']:,.2f} ({vencimentos['percentual_proximo_30_dias']:.2f}%)")
-    print(f"Próximos 60 dias: R$ {vencimentos['valor_proximo_60_dias']:,.2f} ({vencimentos['percentual_proximo_60_dias']:.2f}%)")
-    print(f"Próximos 90 dias: R$ {vencimentos['valor_proximo_90_dias']:,.2f} ({vencimentos['percentual_proximo_90_dias']:.2f}%)")
-    print(f"Vencido: R$ {vencimentos['valor_vencido']:,.2f} ({vencimentos['percentual_vencido']:.2f}%)")
+    linhas += [
+        "\n📅 ANÁLISE DE VENCIMENTOS",
+        "-" * 80,
+        f"Próximos 30 dias: R$ {vencimentos['valor_proximo_30_dias']:,.2f} ({vencimentos['percentual_proximo_30_dias']:.2f}%)",
+        f"Próximos 60 dias: R$ {vencimentos['valor_proximo_60_dias']:,.2f} ({vencimentos['percentual_proximo_60_dias']:.2f}%)",
+        f"Próximos 90 dias: R$ {vencimentos['valor_proximo_90_dias']:,.2f} ({vencimentos['percentual_proximo_90_dias']:.2f}%)",
+        f"Vencido: R$ {vencimentos['valor_vencido']:,.2f} ({vencimentos['percentual_vencido']:.2f}%)"
+    ]
     
     # Risco
-    print("\n⚠️  ANÁLISE DE RISCO")
-    print("-" * 80)
-    
-    risco = analisador.analisar_risco_vencimento()
-    print(f"Nível de Risco Geral: {risco['nivel_risco_geral']}")
-    print(f"Risco Crítico: R$ {risco['risco_critico_valor']:,.2f} ({risco['risco_critico_percentual']:.2f}%)")
-    print(f"Risco Moderado: R$ {risco['risco_moderado_valor']:,.2f} ({risco['risco_moderado_percentual']:.2f}%)")
-    print(f"Risco Baixo: R$ {risco['risco_baixo_valor']:,.2f} ({risco['risco_baixo_percentual']:.2f}%)")
+    linhas += [
+        "\n⚠️  ANÁLISE DE RISCO",
+        "-" * 80,
+        f"Nível de Risco Geral: {risco['nivel_risco_geral']}",
+        f"Risco Crítico: R$ {risco['risco_critico_valor']:,.2f} ({risco['risco_critico_percentual']:.2f}%)",
+        f"Risco Moderado: R$ {risco['risco_moderado_valor']:,.2f} ({risco['risco_moderado_percentual']:.2f}%)",
+        f"Risco Baixo: R$ {risco['risco_baixo_valor']:,.2f} ({risco['risco_baixo_percentual']:.2f}%)"
+    ]
     
     # Top Ativos
-    print("\n⭐ TOP 10 ATIVOS")
-    print("-" * 80)
+    linhas += ["\n⭐ TOP 10 ATIVOS", "-" * 80]
+    linhas += [
+        f"{ativo:30} | R$ {valor:12,.2f} | {percentual:6.2f}%"
+        for ativo, valor, percentual
+        in top_ativos[['Ativo', 'Valor', 'Percentual']].itertuples(index=False, name=None)
+    ]
     
-    top_ativos = analisador.obter_top_ativos(10)
-    for _, row in top_ativos.iterrows():
-        print(f"{row['Ativo']:30} | R$ {row['Valor']:12,.2f} | {row['Percentual']:6.2f}%")
+    _escrever_linhas(linhas)
     
     return diversificacao, vencimentos, risco, top_ativos
 
 
-def exemplo_graficos_e_relatorios(processador, carteira, diversificacao, vencimentos, risco, top_ativos):
+def exemplo_graficos_e_relatorios(processador, carteira, diversificacao, vencimentos, risco, top_ativos,
+                                   alocacao, total, stats):
     """Exemplo de geração de gráficos e relatórios."""
     
+    # matplotlib (via gerador_relatorios) só é importado quando os gráficos
+    # são gerados. Como só há saída em PNG: backend Agg, sem interface gráfica
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    import matplotlib.pyplot as plt
+    plt.rcParams['figure.autolayout'] = False
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    plt.rcParams['agg.path.chunksize'] = 10000
+    
+    from core.gerador_relatorios import GeradorGraficos, GeradorRelatorioHTML
+    
     print("\n" + "="*80)
     print("EXEMPLO 3: GRÁFICOS E RELATÓRIOS".center(80))
     print("="*80)
     
-    # Obter dados
-    alocacao, total = processador.obter_resumo_alocacao()
-    stats = processador.obter_estatisticas()
-    
     # Gerar gráficos
     print("\n📈 Gerando gráficos...")
     
-    caminhos_graficos = {}
-    
-    sucesso, caminho = GeradorGraficos.criar_grafico_pizza_alocacao(alocacao)
-    if sucesso:
-        caminhos_graficos['pizza_alocacao'] = caminho
-        print(f"   ✅ Pizza de alocação: {caminho}")
-    
-    sucesso, caminho = GeradorGraficos.criar_grafico_barras_alocacao(alocacao)
-    if sucesso:
-        caminhos_graficos['barras_alocacao'] = caminho
-        print(f"   ✅ Barras de alocação: {caminho}")
+    # Cada gráfico é renderizado em um processo próprio; só (sucesso, caminho) volta
+    tarefas = {
+        'pizza_alocacao': (GeradorGraficos.criar_grafico_pizza_alocacao, alocacao, "Pizza de alocação"),
+        'barras_alocacao': (GeradorGraficos.criar_grafico_barras_alocacao, alocacao, "Barras de alocação"),
+        'vencimentos': (GeradorGraficos.criar_grafico_vencimentos, vencimentos, "Vencimentos"),
+        'risco': (GeradorGraficos.criar_grafico_risco, risco, "Risco"),
+        'top_ativos': (GeradorGraficos.criar_grafico_top_ativos, top_ativos, "Top ativos")
+    }
     
-    sucesso, caminho = GeradorGraficos.criar_grafico_vencimentos(vencimentos)
-    if sucesso:
-        caminhos_graficos['vencimentos'] = caminho
-        print(f"   ✅ Vencimentos: {caminho}")
+    with ProcessPoolExecutor(max_workers=min(len(tarefas), os.cpu_count() or 1)) as executor:
+        futuros = {
+            chave: executor.submit(funcao, argumento)
+            for chave, (funcao, argumento, _) in tarefas.items()
+        }
+        resultados = {chave: futuro.result() for chave, futuro in futuros.items()}
     
-    sucesso, caminho = GeradorGraficos.criar_grafico_risco(risco)
-    if sucesso:
-        caminhos_graficos['risco'] = caminho
-        print(f"   ✅ Risco: {caminho}")
-    
-    sucesso, caminho = GeradorGraficos.criar_grafico_top_ativos(top_ativos)
-    if sucesso:
-        caminhos_graficos['top_ativos'] = caminho
-        print(f"   ✅ Top ativos: {caminho}")
+    caminhos_graficos = {}
+    for chave, (sucesso, caminho) in resultados.items():
+        if sucesso:
+            caminhos_graficos[chave] = caminho
+            print(f"   ✅ {tarefas[chave][2]}: {caminho}")
     
     # Gerar relatório HTML
     print("\n🌐 Gerando relatório HTML...")
     
-    sucesso, html = GeradorRelatorioHTML.gerar_relatorio_html(
-        nome_cliente="Cliente Exemplo",
-        data_relatorio=datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
-        estatisticas=stats,
-        alocacao=alocacao,
-        diversificacao=diversificacao,
-        vencimentos=vencimentos,
-        risco=risco,
-        top_ativos=top_ativos,
-        caminhos_graficos=caminhos_graficos
-    )
+    # O HTML é gravado trecho a trecho, com buffer de 1 MB
+    caminho_html = '/tmp/relatorio_exemplo.html'
+    with open(caminho_html, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        sucesso, _ = GeradorRelatorioHTML.gerar_relatorio_html(
+            nome_cliente="Cliente Exemplo",
+            data_relatorio=datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
+            estatisticas=stats,
+            alocacao=alocacao,
+            diversificacao=diversificacao,
+            vencimentos=vencimentos,
+            risco=risco,
+            top_ativos=top_ativos,
+            caminhos_graficos=caminhos_graficos,
+            saida=f
+        )
     
     if sucesso:
-        caminho_html = '/tmp/relatorio_exemplo.html'
-        with open(caminho_html, 'w', encoding='utf-8') as f:
-            f.write(html)
         print(f"   ✅ Relatório HTML: {caminho_html}")
     
     # Exportar Excel
@@ -286,13 +356,16 @@ def main():
     
     try:
         # Exemplo 1: Básico
-        processador, carteira = exemplo_basico()
+        processador, carteira, alocacao, total, stats = exemplo_basico()
         
         # Exemplo 2: Análises Avançadas
         diversificacao, vencimentos, risco, top_ativos = exemplo_analises_avancadas(processador, carteira)
         
         # Exemplo 3: Gráficos e Relatórios
-        exemplo_graficos_e_relatorios(processador, carteira, diversificacao, vencimentos, risco, top_ativos)
+        exemplo_graficos_e_relatorios(
+            processador, carteira, diversificacao, vencimentos, risco, top_ativos,
+            alocacao=alocacao, total=total, stats=stats
+        )
         
         print("\n" + "="*80)
         print("✅ EXEMPLOS CONCLUÍDOS COM SUCESSO".center(80))
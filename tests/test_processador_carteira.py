@@ -0,0 +1,90 @@
+"""Testes de regressão do ProcessadorCarteira."""
+
+import pandas as pd
+import pytest
+
+from core.processador_carteira import ProcessadorCarteira, CategoriaInvestimento
+
+
+@pytest.mark.parametrize('extensao', ['csv', 'xlsx'])
+def test_consolidar_classe_vazia_com_classe_texto(tmp_path, extensao):
+    rv = pd.DataFrame({'Ativo': ['PETR4', 'VALE3'], 'Valor Atual': [100.0, 200.0], 'Tipo': ['Ação', 'Ação']})
+    der = pd.DataFrame({'Ativo': ['Futuro IBOV'], 'Valor': [50.0], 'Tipo': [None]})
+    coe = pd.DataFrame({'Ativo': ['COE A', 'COE B'], 'Valor Bruto - Opção Cliente': [10.0, 20.0], 'Tipo': [1, 2]})
+    
+    arquivos = {}
+    for nome, df in [('rv', rv), ('der', der), ('coe', coe)]:
+        caminho = tmp_path / f'{nome}.{extensao}'
+        if extensao == 'csv':
+            df.to_csv(caminho, index=False)
+        else:
+            df.to_excel(caminho, index=False)
+        arquivos[nome] = str(caminho)
+    
+    processador = ProcessadorCarteira()
+    assert processador.carregar_renda_variavel(arquivos['rv'])[0]
+    assert processador.carregar_derivativos(arquivos['der'])[0]
+    assert processador.carregar_coe(arquivos['coe'])[0]
+    
+    carteira = processador.consolidar_carteira()
+    
+    assert len(carteira) == 5
+    assert isinstance(carteira['Classe'].dtype, pd.CategoricalDtype)
+    assert carteira['Classe'].isna().sum() == 1
+    assert set(carteira['Classe'].dropna()) == {'Ação', '1', '2'}
+
+
+@pytest.fixture
+def planilha_cabecalhos(tmp_path):
+    openpyxl = pytest.importorskip('openpyxl')
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(['Ativo', 'Valor Bruto - Opção Cliente', 'Valor Bruto - Opção Cliente', None, 2024, 'Sub Mercado'])
+    ws.append(['A', 100, 1.5, None, 3, 'X'])
+    ws.append([123, 200, None, 'q', 4, 'Y'])
+    caminho = tmp_path / 'cabecalhos.xlsx'
+    wb.save(caminho)
+    return str(caminho)
+
+
+def test_calamine_cabecalhos_como_read_excel(planilha_cabecalhos):
+    pytest.importorskip('python_calamine')
+    from core.processador_carteira import _ler_excel_calamine
+    
+    df = _ler_excel_calamine(planilha_cabecalhos)
+    
+    assert list(df.columns) == [
+        'Ativo', 'Valor Bruto - Opção Cliente', 'Valor Bruto - Opção Cliente.1', 'Unnamed: 3', 2024, 'Sub Mercado'
+    ]
+    pd.testing.assert_frame_equal(df, pd.read_excel(planilha_cabecalhos, engine='openpyxl'))
+
+
+def test_carregar_categoria_com_cabecalho_duplicado(planilha_cabecalhos):
+    processador = ProcessadorCarteira(engine='calamine')
+    
+    sucesso, msg = processador.carregar_renda_fixa(planilha_cabecalhos)
+    
+    assert sucesso, msg
+    df = processador.dados_processados['Renda Fixa']
+    assert df['Valor'].tolist() == [100.0, 200.0]
+    assert df['Ativo'].tolist() == ['A', '123']
+
+
+def test_carregar_todas_com_abas(tmp_path):
+    caminho = tmp_path / 'carteira.xlsx'
+    rf = pd.DataFrame({'Ativo': ['CDB A'], 'Valor Bruto': [100.0]})
+    rv = pd.DataFrame({'Ativo': ['PETR4', 'VALE3'], 'Valor Atual': [10.0, 20.0]})
+    with pd.ExcelWriter(caminho) as writer:
+        rf.to_excel(writer, sheet_name='Renda Fixa', index=False)
+        rv.to_excel(writer, sheet_name='Renda Variável', index=False)
+    
+    processador = ProcessadorCarteira()
+    resultados = processador.carregar_todas({
+        CategoriaInvestimento.RENDA_VARIAVEL: (str(caminho), 'Renda Variável'),
+        CategoriaInvestimento.RENDA_FIXA: (str(caminho), 0),
+    })
+    
+    assert all(sucesso for sucesso, _ in resultados.values())
+    carteira = processador.consolidar_carteira()
+    assert carteira['Ativo'].tolist() == ['PETR4', 'VALE3', 'CDB A']
+    assert carteira['Valor'].tolist() == [10.0, 20.0, 100.0]
@@ -0,0 +1,49 @@
+"""Testes de regressão do ProcessadorPlanilhas."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.processador_planilhas import LimpadorDados
+
+
+@pytest.mark.parametrize('dtype', ['double[pyarrow]', 'int64[pyarrow]', 'Float64', 'Int64'])
+def test_converter_serie_numerica_arrow_volta_float64(dtype):
+    pytest.importorskip('pyarrow')
+    serie = pd.Series([1, None, 3], dtype=dtype, name='Valor')
+    
+    resultado = LimpadorDados.converter_serie_numerica(serie)
+    
+    assert resultado.dtype == np.float64
+    assert resultado.name == 'Valor'
+    assert resultado.isna().tolist() == [False, True, False]
+    assert resultado.sum() == 4.0
+
+
+def test_converter_serie_numerica_numpy_inalterada():
+    serie = pd.Series([1, 2, 3])
+    
+    assert LimpadorDados.converter_serie_numerica(serie) is serie
+
+
+def test_processar_todas_abas_colunas_por_aba(tmp_path):
+    from core.processador_planilhas import ProcessadorMultiplasAbas
+    
+    caminho = tmp_path / 'carteira.xlsx'
+    abas = {
+        f'aba{i}': pd.DataFrame({'Ticker' if i % 2 else 'Ativo': ['A', 'B'],
+                                 'Valor Bruto' if i % 2 else 'Preço': [1.0, 2.0]})
+        for i in range(6)
+    }
+    with pd.ExcelWriter(caminho) as writer:
+        for aba, df in abas.items():
+            df.to_excel(writer, sheet_name=aba, index=False)
+    
+    processador = ProcessadorMultiplasAbas()
+    sucesso, processadas, _ = processador.processar_todas_abas(str(caminho))
+    
+    assert sucesso and list(processadas) == list(abas)
+    for aba, df in abas.items():
+        colunas = processador.colunas_por_aba[aba]
+        assert (colunas['ativo'], colunas['valor']) == tuple(df.columns)
+    assert processador.processador.colunas_detectadas == processador.colunas_por_aba['aba5']
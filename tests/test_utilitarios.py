@@ -0,0 +1,18 @@
+"""Testes de regressão dos utilitários."""
+
+import pytest
+
+from core.utilitarios import GerenciadorArquivos
+
+
+@pytest.mark.parametrize('extensao', ['xlsx', 'csv', 'parquet'])
+def test_validar_arquivo_extensoes_permitidas(tmp_path, extensao):
+    caminho = tmp_path / f'renda_fixa.{extensao}'
+    caminho.write_bytes(b'x')
+    
+    assert GerenciadorArquivos.validar_arquivo(str(caminho)) == (True, "Arquivo válido")
+
+
+@pytest.mark.parametrize('caminho', ['x' * 5000 + '.xlsx', 'carteira\0.xlsx'])
+def test_validar_arquivo_erro_do_sistema(caminho):
+    assert GerenciadorArquivos.validar_arquivo(caminho) == (False, "Arquivo não encontrado")